@@ -1,44 +1,106 @@
-import undetected_chromedriver as uc
-from selenium import webdriver
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
+import atexit
 import json
-import openai
-from typing import Dict, List, Optional
+import os
+from collections import OrderedDict, deque
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional
 import logging
+import queue
+import tempfile
+from logging.handlers import QueueHandler, QueueListener
+
+from src.config import Config
+from src.llm_cache import LLMCache
+from src.script_generator import ScriptGenerator
+
+ELEMENT_INFO_SCRIPT = """
+    var e = arguments[0];
+    return {
+        "tag": e.tagName.toLowerCase(),
+        "id": e.id,
+        "class": e.getAttribute("class"),
+        "text": e.innerText,
+        "aria-label": e.getAttribute("aria-label"),
+        "name": e.name,
+        "type": e.type,
+        "href": e.href,
+        "value": e.value,
+        "placeholder": e.placeholder,
+        "dom": e.outerHTML
+    };
+"""
+
+# Element fields that identify an element for locator reuse
+LOCATOR_CACHE_FIELDS = ("tag", "id", "class", "aria-label", "name", "type", "placeholder", "text", "href")
+LOCATOR_CACHE_SIZE = 4096
 
 class WebAutomationTool:
-    def __init__(self, api_key: str):
+    # Idle browsers kept alive between tool instances to skip Chrome startup
+    _driver_pool: List = []
+
+    def __init__(self, api_key: str, actions_file: Optional[str] = None):
         """
         Initialize the Web Automation Tool
         
         Args:
             api_key (str): OpenAI API key for LLM integration
+            actions_file (str, optional): JSONL file recorded actions are streamed to;
+                defaults to a temporary file of this instance, removed on cleanup
         """
         self.driver = None
-        self.actions = []
+        self.actions = deque()
+        self.actions_file = actions_file
+        # Opened on the first recorded action, so idle instances never create or truncate it
+        self._actions_log = None
+        self._owns_actions_file = actions_file is None
+        import openai
         self.openai = openai
         self.openai.api_key = api_key
+        self.llm_cache = LLMCache(Config.CACHE_DIR)
+        self._locator_cache = OrderedDict()
+        self.script_generator = ScriptGenerator()
         self.setup_logging()
     
     def setup_logging(self):
         """Configure logging for the automation tool"""
-        logging.basicConfig(
-            level=logging.INFO,
-            format='%(asctime)s - %(levelname)s - %(message)s',
-            handlers=[
-                logging.FileHandler('automation.log'),
-                logging.StreamHandler()
-            ]
-        )
+        if not logging.getLogger().handlers:
+            # Write the log file from a background thread instead of the caller
+            log_queue = queue.Queue(-1)
+            listener = QueueListener(log_queue, logging.FileHandler('automation.log'))
+            listener.start()
+            atexit.register(listener.stop)
+            logging.basicConfig(
+                level=logging.INFO,
+                format='%(asctime)s - %(levelname)s - %(message)s',
+                handlers=[
+                    QueueHandler(log_queue),
+                    logging.StreamHandler()
+                ]
+            )
         self.logger = logging.getLogger(__name__)
 
     def initialize_browser(self):
-        """Initialize the browser with undetected-chromedriver"""
+        """Initialize the browser with undetected-chromedriver, reusing an idle pooled one if available"""
         try:
-            self.driver = uc.Chrome()
-            self.driver.maximize_window()
+            if self._driver_pool:
+                self.driver = self._driver_pool.pop()
+            else:
+                # Imported only when a new browser is launched; it is heavy and pooled reuse never needs it
+                import undetected_chromedriver as uc
+
+                options = uc.ChromeOptions()
+                # Return from driver.get once the DOM is interactive instead of fully loaded
+                options.page_load_strategy = "eager"
+                # Locating elements needs the DOM only, so skip images and notification prompts
+                options.add_experimental_option("prefs", {
+                    "profile.managed_default_content_settings.images": 2,
+                    "profile.default_content_setting_values.notifications": 2
+                })
+                self.driver = uc.Chrome(options=options)
+                self.driver.execute_cdp_cmd("Network.setCacheDisabled", {"cacheDisabled": False})
+                # Explicit waits are the only wait mechanism; implicit waits would compound with them
+                self.driver.implicitly_wait(0)
+                self.driver.maximize_window()
             self.logger.info("Browser initialized successfully")
         except Exception as e:
             self.logger.error(f"Failed to initialize browser: {str(e)}")
@@ -69,23 +131,42 @@ class WebAutomationTool:
             Dict: Dictionary containing element attributes
         """
         try:
-            return {
-                "tag": element.tag_name,
-                "id": element.get_attribute("id"),
-                "class": element.get_attribute("class"),
-                "text": element.text,
-                "aria-label": element.get_attribute("aria-label"),
-                "name": element.get_attribute("name"),
-                "type": element.get_attribute("type"),
-                "href": element.get_attribute("href"),
-                "value": element.get_attribute("value"),
-                "placeholder": element.get_attribute("placeholder"),
-                "dom": element.get_attribute("outerHTML")
-            }
+            # Read every attribute in a single round-trip instead of one per field
+            return self.driver.execute_script(ELEMENT_INFO_SCRIPT, element)
         except Exception as e:
             self.logger.error(f"Failed to get element info: {str(e)}")
             return {}
 
+    def _cached_completion(self, prompt: str, parse: Callable[[str], Any]) -> Any:
+        """
+        Run a deterministic chat completion, reusing cached responses
+
+        Only responses that parse successfully are cached, so a malformed
+        answer is retried on the next call rather than replayed.
+
+        Args:
+            prompt (str): User prompt sent to the model
+            parse (Callable[[str], Any]): Converts the response text into the returned value
+
+        Returns:
+            Any: Parsed response
+        """
+        messages = [{"role": "user", "content": prompt}]
+        key = LLMCache.make_key("gpt-3.5-turbo", messages, temperature=0)
+        content = self.llm_cache.get(key)
+        if content is not None:
+            return parse(content)
+
+        response = self.openai.ChatCompletion.create(
+            model="gpt-3.5-turbo",
+            messages=messages,
+            temperature=0
+        )
+        content = response.choices[0].message.content
+        result = parse(content)
+        self.llm_cache.set(key, content)
+        return result
+
     def generate_locators(self, element_info: Dict) -> Dict[str, str]:
         """
         Generate unique locators using LLM
@@ -96,6 +177,12 @@ class WebAutomationTool:
         Returns:
             Dict[str, str]: Dictionary containing generated locators
         """
+        # Repeated interactions with the same element reuse its locators without an LLM call
+        key = tuple(element_info.get(field) for field in LOCATOR_CACHE_FIELDS)
+        if key in self._locator_cache:
+            self._locator_cache.move_to_end(key)
+            return dict(self._locator_cache[key])
+
         try:
             prompt = f"""
             Generate unique locators (ID, XPath, and CSS selector) for the following element:
@@ -115,12 +202,10 @@ class WebAutomationTool:
             }}
             """
 
-            response = self.openai.ChatCompletion.create(
-                model="gpt-3.5-turbo",
-                messages=[{"role": "user", "content": prompt}]
-            )
-
-            locators = json.loads(response.choices[0].message.content)
+            locators = self._cached_completion(prompt, json.loads)
+            self._locator_cache[key] = dict(locators)
+            if len(self._locator_cache) > LOCATOR_CACHE_SIZE:
+                self._locator_cache.popitem(last=False)
             self.logger.info("Successfully generated locators")
             return locators
 
@@ -141,11 +226,22 @@ class WebAutomationTool:
             "type": action_type,
             "element_info": element_info,
             "locators": locators,
-            "timestamp": import datetime; datetime.datetime.now().isoformat()
+            "timestamp": datetime.now().isoformat()
         }
         self.actions.append(action)
+        if self._actions_log is None:
+            self._open_actions_log()
+        self._actions_log.write(json.dumps(action) + "\n")
         self.logger.info(f"Recorded action: {action_type}")
 
+    def _open_actions_log(self):
+        """Open the JSONL log recorded actions are streamed to"""
+        if self._owns_actions_file:
+            fd, self.actions_file = tempfile.mkstemp(prefix="actions-", suffix=".jsonl")
+            self._actions_log = os.fdopen(fd, "w", encoding="utf-8")
+        else:
+            self._actions_log = open(self.actions_file, "w", encoding="utf-8")
+
     def generate_script(self, framework: str, language: str) -> str:
         """
         Generate automation script based on recorded actions
@@ -158,19 +254,21 @@ class WebAutomationTool:
             str: Generated automation script
         """
         try:
+            if language.lower() == "python" and framework.lower() in ("selenium", "playwright"):
+                # Templated cases are rendered locally without an LLM round-trip
+                generated_script = self.script_generator.generate_script(self.actions, framework)
+                self.logger.info(f"Successfully generated {framework} script in {language}")
+                return generated_script
+
+            recorded_actions = "\n".join(map(json.dumps, self.actions))
             prompt = f"""
-            Generate a {framework} script in {language} for the following actions:
-            {json.dumps(self.actions, indent=2)}
+            Generate a {framework} script in {language} for the following actions, one JSON object per line:
+            {recorded_actions}
             
             Include proper imports, error handling, and comments.
             """
 
-            response = self.openai.ChatCompletion.create(
-                model="gpt-3.5-turbo",
-                messages=[{"role": "user", "content": prompt}]
-            )
-
-            generated_script = response.choices[0].message.content
+            generated_script = self._cached_completion(prompt, str)
             self.logger.info(f"Successfully generated {framework} script in {language}")
             return generated_script
 
@@ -187,15 +285,42 @@ class WebAutomationTool:
             filename (str): Output filename
         """
         try:
-            with open(filename, 'w') as f:
+            # Write to a temporary file and swap it in so a failed write never leaves a partial script
+            tmp_filename = filename + ".tmp"
+            with open(tmp_filename, 'w', encoding='utf-8', buffering=1 << 20) as f:
                 f.write(script)
+            os.replace(tmp_filename, filename)
             self.logger.info(f"Script saved to {filename}")
         except Exception as e:
             self.logger.error(f"Failed to save script: {str(e)}")
             raise
 
     def cleanup(self):
-        """Clean up resources"""
+        """Clean up resources, returning the browser to the pool for reuse"""
         if self.driver:
-            self.driver.quit()
+            try:
+                self.driver.delete_all_cookies()
+                self.driver.get("about:blank")
+                self._driver_pool.append(self.driver)
+            except Exception as e:
+                self.logger.error(f"Failed to reset browser for reuse: {str(e)}")
+                self.driver.quit()
+            self.driver = None
+        if self._actions_log is not None and not self._actions_log.closed:
+            self._actions_log.close()
+            if self._owns_actions_file:
+                os.remove(self.actions_file)
         self.logger.info("Cleanup completed")
+
+    @classmethod
+    def shutdown(cls):
+        """Quit every pooled browser"""
+        while cls._driver_pool:
+            try:
+                cls._driver_pool.pop().quit()
+            except Exception:
+                pass
+
+
+# Pooled browsers outlive individual tool instances; quit them when the interpreter exits
+atexit.register(WebAutomationTool.shutdown)
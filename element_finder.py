@@ -1,13 +1,37 @@
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
 from typing import Optional
 import logging
+import time
+
+POLL_INTERVAL = 0.1
+
+# Tries each [strategy, value] pair in order and returns the first matching element
+FIND_ELEMENT_SCRIPT = """
+    var candidates = arguments[0];
+    for (var i = 0; i < candidates.length; i++) {
+        var type = candidates[i][0], value = candidates[i][1], el = null;
+        try {
+            if (type === 'id') {
+                el = document.getElementById(value);
+            } else if (type === 'xpath') {
+                el = document.evaluate(value, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+            } else if (type === 'css') {
+                el = document.querySelector(value);
+            }
+        } catch (e) {
+            el = null;
+        }
+        if (el && el.nodeType === 1) {
+            return el;
+        }
+    }
+    return null;
+"""
 
 class ElementFinder:
-    def __init__(self, driver):
+    def __init__(self, driver, poll_frequency: float = POLL_INTERVAL):
         self.driver = driver
         self.logger = logging.getLogger(__name__)
+        self.poll_frequency = poll_frequency
 
     def find_element_by_locators(self, locators: dict, timeout: int = 10) -> Optional[object]:
         """
@@ -20,22 +44,20 @@ class ElementFinder:
         Returns:
             Optional[object]: WebElement if found, None otherwise
         """
-        for locator_type, locator_value in locators.items():
+        candidates = [[locator_type, locator_value] for locator_type, locator_value in locators.items() if locator_value]
+        if not candidates:
+            return None
+
+        deadline = time.monotonic() + timeout
+        while True:
             try:
-                if locator_type == "id":
-                    return WebDriverWait(self.driver, timeout).until(
-                        EC.presence_of_element_located((By.ID, locator_value))
-                    )
-                elif locator_type == "xpath":
-                    return WebDriverWait(self.driver, timeout).until(
-                        EC.presence_of_element_located((By.XPATH, locator_value))
-                    )
-                elif locator_type == "css":
-                    return WebDriverWait(self.driver, timeout).until(
-                        EC.presence_of_element_located((By.CSS_SELECTOR, locator_value))
-                    )
+                element = self.driver.execute_script(FIND_ELEMENT_SCRIPT, candidates)
+                if element:
+                    return element
             except Exception as e:
-                self.logger.debug(f"Failed to find element with {locator_type}: {str(e)}")
-                continue
-        
-        return None 
\ No newline at end of file
+                if self.logger.isEnabledFor(logging.DEBUG):
+                    self.logger.debug(f"Failed to find element with {candidates}: {str(e)}")
+
+            if time.monotonic() >= deadline:
+                return None
+            time.sleep(self.poll_frequency)
@@ -7,6 +7,17 @@ class Config:
     OPENAI_API_KEY = os.getenv('OPENAI_API_KEY')
     LOG_FILE = 'logs/automation.log'
     SCRIPT_OUTPUT_DIR = 'generated_scripts'
+    CACHE_DIR = '.cache/llm'
+    ACTION_CACHE_FILE = os.getenv('ACTION_CACHE_FILE') or os.path.expanduser('~/.cache/auto_tool/actions.json')
+    ACTION_CACHE_SIZE = 100
+    OPENAI_MODEL = 'gpt-4o-mini'
     DEFAULT_TIMEOUT = 10
+    # Per-attempt wait for generated locators; execute_step retries and rescans on a miss
+    LOOKUP_TIMEOUT = 2
+    POLL_FREQUENCY = 0.1
+    MAX_CONCURRENT_LLM_CALLS = 20
+    VERIFY_CONFIDENCE_THRESHOLD = 0.9
+    LOCAL_MATCH_THRESHOLD = 0.85
+    MAX_PARALLEL_STEPS = 4
     DEFAULT_FRAMEWORK = 'selenium'
     DEFAULT_LANGUAGE = 'python' 
\ No newline at end of file
@@ -1,25 +1,108 @@
+from selenium.common.exceptions import NoSuchElementException, StaleElementReferenceException
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from typing import Optional, Dict
+from typing import Optional, Dict, List
 import logging
+import time
+
+from .config import Config
+
+# Tries each [strategy, value] pair in order and returns the first matching element
+FIND_FIRST_FUNCTION = """
+    function findFirst(candidates) {
+        for (var i = 0; i < candidates.length; i++) {
+            var type = candidates[i][0], value = candidates[i][1], el = null;
+            try {
+                if (type === 'id') {
+                    el = document.getElementById(value);
+                } else if (type === 'xpath') {
+                    el = document.evaluate(value, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+                } else if (type === 'css') {
+                    el = document.querySelector(value);
+                } else if (type === 'name') {
+                    el = document.getElementsByName(value)[0];
+                } else if (type === 'class') {
+                    el = document.getElementsByClassName(value)[0];
+                } else if (type === 'link_text') {
+                    el = Array.from(document.links).find(a => a.innerText.trim() === value);
+                } else if (type === 'partial_link_text') {
+                    el = Array.from(document.links).find(a => a.innerText.includes(value));
+                }
+            } catch (e) {
+                el = null;
+            }
+            if (el && el.nodeType === 1) {
+                return el;
+            }
+        }
+        return null;
+    }
+"""
+
+FIND_ELEMENT_SCRIPT = FIND_FIRST_FUNCTION + "return findFirst(arguments[0]);"
+
+FIND_ALL_MATCHING_SCRIPT = FIND_FIRST_FUNCTION + "return arguments[0].map(findFirst);"
 
 class ElementFinder:
-    def __init__(self, driver):
+    _BY = {
+        "id": By.ID,
+        "xpath": By.XPATH,
+        "css": By.CSS_SELECTOR,
+        "name": By.NAME,
+        "class": By.CLASS_NAME,
+        "link_text": By.LINK_TEXT,
+        "partial_link_text": By.PARTIAL_LINK_TEXT,
+    }
+
+    def __init__(self, driver, poll_frequency: float = Config.POLL_FREQUENCY):
         """
         Initialize ElementFinder with a WebDriver instance
         
         Args:
             driver: Selenium WebDriver instance
+            poll_frequency (float): Seconds to sleep between lookups while waiting
         """
         self.driver = driver
         self.logger = logging.getLogger(__name__)
-        self.wait = WebDriverWait(self.driver, 10)  # Default timeout of 10 seconds
+        self.poll_frequency = poll_frequency
+        self._waits: Dict[float, WebDriverWait] = {}
+        self.wait = self.get_wait(Config.DEFAULT_TIMEOUT)
+
+    def get_wait(self, timeout: float) -> WebDriverWait:
+        """
+        Return a WebDriverWait for the given timeout, reusing one per timeout value
+        
+        Args:
+            timeout (float): Wait timeout in seconds
+            
+        Returns:
+            WebDriverWait: Wait polling at the finder's poll frequency
+        """
+        wait = self._waits.get(timeout)
+        if wait is None:
+            wait = self._waits[timeout] = WebDriverWait(
+                self.driver,
+                timeout,
+                poll_frequency=self.poll_frequency,
+                ignored_exceptions=(StaleElementReferenceException, NoSuchElementException)
+            )
+        return wait
+
+    def _candidates(self, locators: Dict[str, str]) -> List[List[str]]:
+        """Convert a locator dict into ordered [strategy, value] pairs the finder scripts understand"""
+        return [
+            [locator_type, locator_value]
+            for locator_type, locator_value in locators.items()
+            if locator_value and locator_type in self._BY
+        ]
 
     def find_element_by_locators(self, locators: Dict[str, str], timeout: int = 10) -> Optional[object]:
         """
         Find element using multiple locator strategies
         
+        All strategies are tried in order inside the browser with a single
+        script call per poll, until one matches or the timeout expires.
+        
         Args:
             locators (Dict[str, str]): Dictionary of locator strategies and values
             timeout (int): Wait timeout in seconds
@@ -27,44 +110,88 @@ class ElementFinder:
         Returns:
             Optional[object]: WebElement if found, None otherwise
         """
-        for locator_type, locator_value in locators.items():
+        candidates = self._candidates(locators)
+        if not candidates:
+            return None
+
+        deadline = time.monotonic() + timeout
+        while True:
             try:
-                if not locator_value:
-                    continue
+                element = self.driver.execute_script(FIND_ELEMENT_SCRIPT, candidates)
+                if element:
+                    return element
+            except Exception as e:
+                if self.logger.isEnabledFor(logging.DEBUG):
+                    self.logger.debug("Failed to find element with %s. Error: %s", candidates, e)
+
+            if time.monotonic() >= deadline:
+                return None
+            time.sleep(self.poll_frequency)
+
+    def find_all_matching(self, locator_groups: List[Dict[str, str]], timeout: float = 0) -> List[Optional[object]]:
+        """
+        Resolve many locator groups in a single script call per poll
+        
+        Args:
+            locator_groups (List[Dict[str, str]]): One locator dictionary per element
+            timeout (float): Seconds to keep polling while no group matches
+            
+        Returns:
+            List[Optional[object]]: First matching WebElement for each group, None where nothing matched
+        """
+        if not locator_groups:
+            return []
 
-                if locator_type == "id":
-                    return self.wait.until(
-                        EC.presence_of_element_located((By.ID, locator_value))
-                    )
-                elif locator_type == "xpath":
-                    return self.wait.until(
-                        EC.presence_of_element_located((By.XPATH, locator_value))
-                    )
-                elif locator_type == "css":
-                    return self.wait.until(
-                        EC.presence_of_element_located((By.CSS_SELECTOR, locator_value))
-                    )
-                elif locator_type == "name":
-                    return self.wait.until(
-                        EC.presence_of_element_located((By.NAME, locator_value))
-                    )
-                elif locator_type == "class":
-                    return self.wait.until(
-                        EC.presence_of_element_located((By.CLASS_NAME, locator_value))
-                    )
-                elif locator_type == "link_text":
-                    return self.wait.until(
-                        EC.presence_of_element_located((By.LINK_TEXT, locator_value))
-                    )
-                elif locator_type == "partial_link_text":
-                    return self.wait.until(
-                        EC.presence_of_element_located((By.PARTIAL_LINK_TEXT, locator_value))
-                    )
+        candidates = [self._candidates(locators) for locators in locator_groups]
+        deadline = time.monotonic() + timeout
+        while True:
+            try:
+                matches = self.driver.execute_script(FIND_ALL_MATCHING_SCRIPT, candidates)
+                if any(matches):
+                    return matches
             except Exception as e:
-                self.logger.debug(f"Failed to find element with {locator_type}: {locator_value}. Error: {str(e)}")
-                continue
+                if self.logger.isEnabledFor(logging.DEBUG):
+                    self.logger.debug("Failed to resolve locator groups. Error: %s", e)
+                matches = [None] * len(locator_groups)
+
+            if time.monotonic() >= deadline:
+                return matches
+            time.sleep(self.poll_frequency)
+
+    def _find_matching_element(self, locators: Dict[str, str], timeout: int, condition, description: str) -> Optional[object]:
+        """
+        Poll all locator strategies until one yields an element satisfying condition
+        
+        Each poll uses non-blocking find_elements lookups, so the timeout
+        bounds the whole search rather than each individual strategy.
         
-        return None
+        Args:
+            locators (Dict[str, str]): Dictionary of locator strategies and values
+            timeout (int): Total wait timeout in seconds
+            condition: Callable taking a WebElement and returning bool
+            description (str): Element state used in debug messages
+            
+        Returns:
+            Optional[object]: WebElement if found, None otherwise
+        """
+        deadline = time.monotonic() + timeout
+        while True:
+            for locator_type, locator_value in locators.items():
+                by = self._BY.get(locator_type)
+                if by is None or not locator_value:
+                    continue
+
+                try:
+                    elements = self.driver.find_elements(by, locator_value)
+                    if elements and condition(elements[0]):
+                        return elements[0]
+                except Exception as e:
+                    if self.logger.isEnabledFor(logging.DEBUG):
+                        self.logger.debug("Failed to find %s element with %s: %s. Error: %s", description, locator_type, locator_value, e)
+
+            if time.monotonic() >= deadline:
+                return None
+            time.sleep(self.poll_frequency)
 
     def find_clickable_element(self, locators: Dict[str, str], timeout: int = 10) -> Optional[object]:
         """
@@ -77,28 +204,9 @@ class ElementFinder:
         Returns:
             Optional[object]: WebElement if found and clickable, None otherwise
         """
-        for locator_type, locator_value in locators.items():
-            try:
-                if not locator_value:
-                    continue
-
-                if locator_type == "id":
-                    return self.wait.until(
-                        EC.element_to_be_clickable((By.ID, locator_value))
-                    )
-                elif locator_type == "xpath":
-                    return self.wait.until(
-                        EC.element_to_be_clickable((By.XPATH, locator_value))
-                    )
-                elif locator_type == "css":
-                    return self.wait.until(
-                        EC.element_to_be_clickable((By.CSS_SELECTOR, locator_value))
-                    )
-            except Exception as e:
-                self.logger.debug(f"Failed to find clickable element with {locator_type}: {locator_value}. Error: {str(e)}")
-                continue
-        
-        return None
+        return self._find_matching_element(
+            locators, timeout, lambda element: element.is_displayed() and element.is_enabled(), "clickable"
+        )
 
     def find_visible_element(self, locators: Dict[str, str], timeout: int = 10) -> Optional[object]:
         """
@@ -111,28 +219,9 @@ class ElementFinder:
         Returns:
             Optional[object]: WebElement if found and visible, None otherwise
         """
-        for locator_type, locator_value in locators.items():
-            try:
-                if not locator_value:
-                    continue
-
-                if locator_type == "id":
-                    return self.wait.until(
-                        EC.visibility_of_element_located((By.ID, locator_value))
-                    )
-                elif locator_type == "xpath":
-                    return self.wait.until(
-                        EC.visibility_of_element_located((By.XPATH, locator_value))
-                    )
-                elif locator_type == "css":
-                    return self.wait.until(
-                        EC.visibility_of_element_located((By.CSS_SELECTOR, locator_value))
-                    )
-            except Exception as e:
-                self.logger.debug(f"Failed to find visible element with {locator_type}: {locator_value}. Error: {str(e)}")
-                continue
-        
-        return None
+        return self._find_matching_element(
+            locators, timeout, lambda element: element.is_displayed(), "visible"
+        )
 
     def wait_for_element_presence(self, locators: Dict[str, str], timeout: int = 10) -> bool:
         """
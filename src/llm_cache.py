@@ -0,0 +1,40 @@
+import hashlib
+import json
+from typing import Dict, List, Optional
+
+import diskcache
+
+
+class LLMCache:
+    def __init__(self, directory: str):
+        """
+        Initialize an exact-match cache for LLM completions
+
+        Args:
+            directory (str): Directory backing the on-disk cache
+        """
+        self.cache = diskcache.Cache(directory)
+
+    @staticmethod
+    def make_key(model: str, messages: List[Dict], **params) -> str:
+        """
+        Build a deterministic cache key for a completion request
+
+        Args:
+            model (str): Model name
+            messages (List[Dict]): Chat messages sent to the model
+            **params: Any other request parameters that affect the response
+
+        Returns:
+            str: SHA-256 hex digest of the request
+        """
+        payload = json.dumps({"model": model, "messages": messages, **params}, sort_keys=True)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        """Return the cached completion for key, or None on a miss"""
+        return self.cache.get(key)
+
+    def set(self, key: str, content: str):
+        """Store a completion under key"""
+        self.cache.set(key, content)
@@ -1,10 +1,77 @@
-from selenium import webdriver
-from selenium.webdriver.common.by import By
-from selenium.webdriver.common.keys import Keys
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-import time
-from typing import List, Dict
+import json
+import threading
+from string import Template
+from typing import List, Dict, Tuple
+
+SELENIUM_NAVIGATE_STEP = Template("""
+        # Navigate to URL
+        driver.get($url)""")
+
+SELENIUM_INPUT_STEP = Template("""
+        # Wait for input element and enter text
+        element = wait.until(EC.presence_of_element_located((By.XPATH, $locator)))
+        element.clear()
+        element.send_keys($value)
+        element.send_keys(Keys.RETURN)
+        wait.until(lambda d: d.execute_script("return document.readyState") == "complete")""")
+
+SELENIUM_CLICK_STEP = Template("""
+        # Wait for element to be clickable and click
+        element = wait.until(EC.element_to_be_clickable((By.XPATH, $locator)))
+        element.click()
+        wait.until(lambda d: d.execute_script("return document.readyState") == "complete")""")
+
+PLAYWRIGHT_NAVIGATE_STEP = Template("""
+            # Navigate to URL
+            page.goto($url)
+            page.wait_for_load_state("networkidle")""")
+
+PLAYWRIGHT_INPUT_STEP = Template("""
+            # Fill input field and submit
+            page.fill($locator, $value)
+            page.keyboard.press("Enter")
+            page.wait_for_load_state("networkidle")""")
+
+PLAYWRIGHT_CLICK_STEP = Template("""
+            # Click element
+            page.click($locator)
+            page.wait_for_load_state("networkidle")""")
+
+def _to_literal(value) -> str:
+    """
+    Render a recorded value as a safely escaped Python string literal
+    
+    Generated locators may hold a list of candidates, in which case the
+    first (primary) one is used.
+    """
+    if isinstance(value, list):
+        value = value[0] if value else ""
+    return json.dumps(value)
+
+def _freeze(value):
+    """Make a recorded value hashable so it can be part of a cache key"""
+    return tuple(value) if isinstance(value, list) else value
+
+def _render_key(action: Dict) -> tuple:
+    """Return the action fields that affect its rendered snippet"""
+    element_info, locators = action["element_info"], action["locators"]
+    return (
+        action["type"],
+        _freeze(element_info.get("url")),
+        _freeze(element_info.get("value")),
+        _freeze(locators.get("xpath")),
+        _freeze(locators.get("css"))
+    )
+
+# Maximum number of generated scripts kept per generator
+SCRIPT_CACHE_SIZE = 64
+# Maximum number of rendered step snippets kept per generator
+SNIPPET_CACHE_SIZE = 1024
+
+def _split_template(template: str) -> tuple:
+    """Split a script template around its {test_steps} slot into literal head and tail"""
+    head, tail = template.split("{test_steps}")
+    return tuple(part.replace("{{", "{").replace("}}", "}") for part in (head, tail))
 
 class ScriptGenerator:
     def __init__(self):
@@ -14,7 +81,6 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-import time
 
 def run_test():
     # Initialize the driver
@@ -28,7 +94,6 @@ def run_test():
     except Exception as e:
         print(f"Test failed: {{str(e)}}")
     finally:
-        time.sleep(2)  # Small delay before closing
         driver.quit()
 
         
@@ -38,7 +103,6 @@ if __name__ == "__main__":
 
         self.playwright_template = """
 from playwright.sync_api import sync_playwright
-import time
 
 def run_test():
     with sync_playwright() as p:
@@ -52,71 +116,134 @@ def run_test():
         except Exception as e:
             print(f"Test failed: {{str(e)}}")
         finally:
-            time.sleep(2)  # Small delay before closing
             browser.close()
 
 if __name__ == "__main__":
     run_test()
 """
 
-    def generate_selenium_steps(self, actions: List[Dict]) -> str:
+        self._selenium_handlers = {
+            "navigate": self._selenium_navigate,
+            "input": self._selenium_input,
+            "click": self._selenium_click,
+        }
+        self._playwright_handlers = {
+            "navigate": self._playwright_navigate,
+            "input": self._playwright_input,
+            "click": self._playwright_click,
+        }
+        # The templates are fixed, so they are split once and scripts are assembled by concatenation
+        self._selenium_parts = _split_template(self.selenium_template)
+        self._playwright_parts = _split_template(self.playwright_template)
+        # (framework, rendered action fields) -> generated script fragments
+        self._script_cache: Dict[tuple, Tuple[str, ...]] = {}
+        # (handler, rendered action fields) -> step snippet
+        self._snippet_cache: Dict[tuple, str] = {}
+        # One generator may render scripts from several threads at once
+        self._cache_lock = threading.Lock()
+
+    def _selenium_navigate(self, action: Dict) -> str:
+        return SELENIUM_NAVIGATE_STEP.substitute(url=_to_literal(action["element_info"].get("url", "")))
+
+    def _selenium_input(self, action: Dict) -> str:
+        return SELENIUM_INPUT_STEP.substitute(
+            locator=_to_literal(action["locators"].get("xpath", "")),
+            value=_to_literal(action["element_info"].get("value", ""))
+        )
+
+    def _selenium_click(self, action: Dict) -> str:
+        return SELENIUM_CLICK_STEP.substitute(locator=_to_literal(action["locators"].get("xpath", "")))
+
+    def _playwright_navigate(self, action: Dict) -> str:
+        return PLAYWRIGHT_NAVIGATE_STEP.substitute(url=_to_literal(action["element_info"].get("url", "")))
+
+    def _playwright_input(self, action: Dict) -> str:
+        return PLAYWRIGHT_INPUT_STEP.substitute(
+            locator=_to_literal(action["locators"].get("css", "")),
+            value=_to_literal(action["element_info"].get("value", ""))
+        )
+
+    def _playwright_click(self, action: Dict) -> str:
+        return PLAYWRIGHT_CLICK_STEP.substitute(locator=_to_literal(action["locators"].get("css", "")))
+
+    def _render_step_list(self, actions: List[Dict], handlers: Dict) -> List[str]:
+        """Render each action with its handler, skipping unsupported action types"""
+        get_handler = handlers.get
+        snippets = self._snippet_cache
         steps = []
+        append = steps.append
+        lock = self._cache_lock
         for action in actions:
-            if action["type"] == "navigate":
-                url = action["element_info"].get("url", "")
-                steps.append(f"""
-        # Navigate to URL
-        driver.get("{url}")
-        time.sleep(2)  # Wait for page load""")
-                
-            elif action["type"] == "input":
-                locator = action["locators"].get("xpath", "")
-                input_value = action["element_info"].get("value", "")
-                steps.append(f"""
-        # Wait for input element and enter text
-        element = wait.until(EC.presence_of_element_located((By.XPATH, "{locator}")))
-        element.clear()
-        element.send_keys("{input_value}")
-        element.send_keys(Keys.RETURN)
-        time.sleep(2)  # Wait for search results""")
-                
-            elif action["type"] == "click":
-                locator = action["locators"].get("xpath", "")
-                steps.append(f"""
-        # Wait for element to be clickable and click
-        element = wait.until(EC.element_to_be_clickable((By.XPATH, "{locator}")))
-        element.click()
-        time.sleep(2)  # Wait for action to complete""")
-        
-        return "\n".join(steps)
+            handler = get_handler(action["type"])
+            if handler is None:
+                continue
+            # Identical actions (e.g. repeated clicks on one element) are rendered once
+            key = (handler, _render_key(action))
+            with lock:
+                snippet = snippets.get(key)
+            if snippet is None:
+                # Rendered outside the lock so concurrent scripts render in parallel
+                snippet = handler(action)
+                with lock:
+                    if len(snippets) >= SNIPPET_CACHE_SIZE:
+                        snippets.clear()
+                    snippets[key] = snippet
+            append(snippet)
+        return steps
+
+    def _render_steps(self, actions: List[Dict], handlers: Dict) -> str:
+        return "\n".join(self._render_step_list(actions, handlers))
+
+    def generate_selenium_steps(self, actions: List[Dict]) -> str:
+        return self._render_steps(actions, self._selenium_handlers)
 
     def generate_playwright_steps(self, actions: List[Dict]) -> str:
-        steps = []
-        for action in actions:
-            if action["type"] == "navigate":
-                url = action["element_info"].get("url", "")
-                steps.append(f"""
-            # Navigate to URL
-            page.goto("{url}")
-            page.wait_for_load_state("networkidle")""")
-                
-            elif action["type"] == "input":
-                locator = action["locators"].get("css", "")
-                input_value = action["element_info"].get("value", "")
-                steps.append(f"""
-            # Fill input field and submit
-            page.fill("{locator}", "{input_value}")
-            page.keyboard.press("Enter")
-            page.wait_for_load_state("networkidle")""")
-                
-            elif action["type"] == "click":
-                locator = action["locators"].get("css", "")
-                steps.append(f"""
-            # Click element
-            page.click("{locator}")
-            page.wait_for_load_state("networkidle")""")
+        return self._render_steps(actions, self._playwright_handlers)
+
+    def generate_script_parts(self, actions: List[Dict], framework: str) -> List[str]:
+        """
+        Generate automation script based on recorded actions, as fragments
         
-        return "\n".join(steps)
+        Callers concatenate the fragments with "".join(parts); this avoids
+        building intermediate strings for the step block.
+        
+        Args:
+            actions (List[Dict]): List of recorded actions
+            framework (str): Target automation framework
+            
+        Returns:
+            List[str]: Script fragments in order
+        """
+        framework_name = framework.lower()
+        if framework_name not in ("selenium", "playwright"):
+            raise ValueError(f"Unsupported framework: {framework}")
+
+        # Unchanged actions render to the same script, so repeated calls reuse it
+        key = (framework_name, tuple(map(_render_key, actions)))
+        with self._cache_lock:
+            parts = self._script_cache.get(key)
+        if parts is not None:
+            return list(parts)
+
+        if framework_name == "selenium":
+            steps = self._render_step_list(actions, self._selenium_handlers)
+            head, tail = self._selenium_parts
+        else:
+            steps = self._render_step_list(actions, self._playwright_handlers)
+            head, tail = self._playwright_parts
+
+        parts = [head]
+        for index, step in enumerate(steps):
+            if index:
+                parts.append("\n")
+            parts.append(step)
+        parts.append(tail)
+
+        with self._cache_lock:
+            if len(self._script_cache) >= SCRIPT_CACHE_SIZE:
+                self._script_cache.clear()
+            self._script_cache[key] = tuple(parts)
+        return parts
 
     def generate_script(self, actions: List[Dict], framework: str) -> str:
         """
@@ -129,11 +256,4 @@ if __name__ == "__main__":
         Returns:
             str: Generated automation script
         """
-        if framework.lower() == "selenium":
-            steps = self.generate_selenium_steps(actions)
-            return self.selenium_template.format(test_steps=steps)
-        elif framework.lower() == "playwright":
-            steps = self.generate_playwright_steps(actions)
-            return self.playwright_template.format(test_steps=steps)
-        else:
-            raise ValueError(f"Unsupported framework: {framework}")
+        return "".join(self.generate_script_parts(actions, framework))
@@ -1,16 +1,29 @@
+import atexit
 import logging
+import queue
+import re
 from datetime import datetime
+from logging.handlers import QueueHandler, QueueListener
+
+_SANITIZE_RE = re.compile(r'[^\w\-.]')
 
 def setup_logger(name: str, log_file: str) -> logging.Logger:
     """Set up logger with file and console handlers"""
     logger = logging.getLogger(name)
+    if logger.handlers:
+        # Already configured by an earlier call
+        return logger
     logger.setLevel(logging.INFO)
     
-    # File handler
+    # File handler, written from a background thread so callers never block on disk I/O
     file_handler = logging.FileHandler(log_file)
     file_handler.setFormatter(
         logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
     )
+    log_queue = queue.Queue(-1)
+    listener = QueueListener(log_queue, file_handler)
+    listener.start()
+    atexit.register(listener.stop)
     
     # Console handler
     console_handler = logging.StreamHandler()
@@ -18,15 +31,17 @@ def setup_logger(name: str, log_file: str) -> logging.Logger:
         logging.Formatter('%(levelname)s: %(message)s')
     )
     
-    logger.addHandler(file_handler)
+    logger.addHandler(QueueHandler(log_queue))
     logger.addHandler(console_handler)
     
     return logger
 
 def generate_timestamp() -> str:
     """Generate a formatted timestamp"""
-    return datetime.now().strftime("%Y%m%d_%H%M%S")
+    t = datetime.now()
+    return f"{t.year:04d}{t.month:02d}{t.day:02d}_{t.hour:02d}{t.minute:02d}{t.second:02d}"
 
 def sanitize_filename(filename: str) -> str:
-    """Sanitize filename by removing invalid characters"""
-    return "".join(c for c in filename if c.isalnum() or c in ('-', '_')).rstrip() 
\ No newline at end of file
+    """Sanitize filename by replacing invalid characters, keeping the extension"""
+    # Leading dots are dropped so the result can never be "." or ".."
+    return _SANITIZE_RE.sub('_', filename).lstrip('.') 
\ No newline at end of file
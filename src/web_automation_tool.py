@@ -1,22 +1,334 @@
-import datetime
-import json
+import asyncio
+import atexit
+import collections
+import contextlib
+import functools
+import logging
 import os
+import re
+import sys
+import threading
 import time
-from typing import Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple
+from urllib.parse import urljoin
 
-import undetected_chromedriver as uc
-from selenium import webdriver
-from selenium.webdriver.common.by import By
-from selenium.webdriver.common.keys import Keys
+import orjson
 
 from .config import Config
-from .element_finder import ElementFinder
 from .exceptions import BrowserInitializationError, ScriptGenerationError, ElementNotFoundError
+from .llm_cache import LLMCache
 from .script_generator import ScriptGenerator
 from .utils import setup_logger, generate_timestamp, sanitize_filename
-from openai import OpenAI
 
-class WebAutomationTool:
+# Browser dependencies are imported where they are first needed, so importing
+# this module (script generation, tests with mocks) does not load them
+if TYPE_CHECKING:
+    import undetected_chromedriver as uc
+    from .element_finder import ElementFinder
+
+# Bump when prompt or response formats change so stale cached completions are ignored
+PROMPT_SCHEMA_VERSION = "3"
+
+ELEMENT_INFO_SCRIPT = """
+    const e = arguments[0];
+    return {
+        "tag": e.tagName.toLowerCase(),
+        "id": e.id,
+        "class": e.getAttribute("class"),
+        "type": e.getAttribute("type"),
+        "name": e.getAttribute("name"),
+        "text": e.innerText,
+        "aria-label": e.getAttribute("aria-label")
+    };
+"""
+
+# Installs a document-wide mutation counter once per page and returns the page's
+# (time origin, mutation count) so callers can tell whether the DOM changed
+DOM_VERSION_SCRIPT = """
+    if (!window.__mutObserver) {
+        window.__mutCount = 0;
+        window.__mutObserver = new MutationObserver(records => { window.__mutCount += records.length; });
+        window.__mutObserver.observe(document, {childList: true, subtree: true, attributes: true});
+    }
+    return [performance.timeOrigin, window.__mutCount];
+"""
+
+# Recorded action types are interned so later comparisons are identity checks
+ACTION_TYPES = {action_type: sys.intern(action_type) for action_type in ("navigate", "click", "input", "submit", "hover", "wait")}
+
+class RecordedAction:
+    """
+    A recorded automation action
+    
+    Slots keep each action smaller and cheaper to build than a dict, while
+    item access (action["type"]) keeps it usable wherever a dict was expected.
+    """
+    __slots__ = ("type", "element_info", "locators", "timestamp")
+
+    def __init__(self, action_type: str, element_info: Dict, locators: Dict[str, str], timestamp):
+        self.type = action_type
+        self.element_info = element_info
+        self.locators = locators
+        self.timestamp = timestamp
+
+    def __getitem__(self, key: str):
+        return getattr(self, key)
+
+    def __setitem__(self, key: str, value):
+        setattr(self, key, value)
+
+# Steps with this prefix are independent of each other and may run concurrently
+PARALLEL_STEP_PREFIX = "parallel:"
+
+# Elements whose contents never contribute to rendered text
+NON_TEXT_TAGS = {"SCRIPT", "STYLE", "NOSCRIPT", "TEMPLATE"}
+
+# Element fields compared against the step when ranking candidates locally
+RANK_FIELDS = ("id", "name", "placeholder", "aria-label", "label", "text", "preceding_text")
+# Number of top-ranked candidates sent to the model
+RANK_TOP_K = 5
+# Step words that describe the action rather than the target element
+RANK_STOP_WORDS = {"click", "on", "enter", "type", "in", "into", "the", "a", "an", "to", "field", "button", "link", "box"}
+WORD_RE = re.compile(r"\w+")
+QUOTED_VALUE_RE = re.compile(r"'([^']*)'")
+
+# Static prompt prefixes come first so repeated calls share a cacheable leading
+# segment; the step and page data are appended at the end of each prompt.
+ANALYZE_ELEMENTS_PROMPT_PREFIX = """Analyze the relevant page elements below for the given step.
+
+Return a JSON response in this format:
+{
+    "action_type": "navigate|input|click",
+    "selected_element": {
+        "xpath": "xpath of the selected element",
+        "css": "css selector of the selected element",
+        "reason": "why this element was selected"
+    },
+    "input_value": "value to input if applicable",
+    "wait_time": recommended wait time in seconds
+}
+
+For search inputs, prefer elements with id 'twotabsearchtextbox' or search-related attributes.
+For clicks, prefer elements with matching text or relevant attributes.
+"""
+
+ANALYZE_STEP_PROMPT_PREFIX = """Analyze the test step below and provide a detailed action plan.
+
+Return a JSON object with exactly this structure (no additional text):
+{
+    "action_type": "navigate|input|click|select|hover|wait|verify",
+    "element_type": "input|button|link|select|div|etc",
+    "element_identification": {
+        "primary_attributes": ["id", "name", "type"],
+        "text_content": "expected text if any",
+        "contextual_hints": ["search", "submit", "next"]
+    },
+    "input_value": "value to input if needed",
+    "wait_conditions": ["presence", "clickable", "visible"],
+    "expected_result": "what should happen after action",
+    "fallback_strategies": ["try alternative locators", "check similar elements"]
+}
+
+Important: Return ONLY the JSON object, no additional text or explanations.
+"""
+
+ELEMENT_LOCATORS_PROMPT_PREFIX = """Generate optimal element locators based on the action plan and available page elements below.
+
+Return a JSON with locator strategies in priority order:
+{
+    "locators": {
+        "id": "id value if available",
+        "xpath": ["primary xpath", "fallback xpath"],
+        "css": ["primary css", "fallback css"],
+        "custom": "any other unique locator strategy"
+    },
+    "confidence_score": 0.0 to 1.0,
+    "verification_attributes": ["attributes to verify correct element"]
+}
+"""
+
+PLAN_AND_LOCATE_PROMPT_PREFIX = """Analyze the test step below and generate optimal element locators for it.
+
+Return a JSON object with exactly this structure:
+{
+    "action_plan": {
+        "action_type": "navigate|input|click|select|hover|wait|verify",
+        "element_type": "input|button|link|select|div|etc",
+        "element_identification": {
+            "primary_attributes": ["id", "name", "type"],
+            "text_content": "expected text if any",
+            "contextual_hints": ["search", "submit", "next"]
+        },
+        "input_value": "value to input if needed",
+        "wait_conditions": ["presence", "clickable", "visible"],
+        "expected_result": "what should happen after action",
+        "fallback_strategies": ["try alternative locators", "check similar elements"]
+    },
+    "locators": {
+        "id": "id value if available",
+        "xpath": ["primary xpath", "fallback xpath"],
+        "css": ["primary css", "fallback css"],
+        "custom": "any other unique locator strategy"
+    },
+    "verification": {
+        "confidence_score": 0.0 to 1.0,
+        "verification_attributes": ["attributes to verify correct element"]
+    }
+}
+
+For navigate steps, locators may be empty.
+"""
+
+VERIFY_MATCH_PROMPT_PREFIX = """Verify if the found element below matches the intended target.
+
+Return a JSON response:
+{
+    "is_match": true/false,
+    "confidence": 0.0 to 1.0,
+    "reason": "explanation of decision"
+}
+"""
+
+LOCATOR_PROMPT_PREFIX = """Generate robust and unique locators for the element below.
+
+Return a JSON with these locator strategies:
+1. XPath - prefer unique attributes and text
+2. CSS Selector - compact and efficient
+3. ID - if available and unique
+
+Consider:
+- Reliability across page updates
+- Performance of the locator
+- Uniqueness in the page context
+- Readability for maintenance
+
+Return only the JSON response.
+"""
+
+JSON_ONLY_SYSTEM_PROMPT = "You are a JSON generator that only returns valid JSON objects without any additional text or explanations."
+
+STRING_LIST_SCHEMA = {"type": "array", "items": {"type": "string"}}
+
+# Strict response schemas: the API guarantees conforming JSON, so replies need no cleanup
+ACTION_PLAN_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "action_type": {"type": "string", "enum": ["navigate", "input", "click", "select", "hover", "wait", "verify"]},
+        "element_type": {"type": "string"},
+        "element_identification": {
+            "type": "object",
+            "properties": {
+                "primary_attributes": STRING_LIST_SCHEMA,
+                "text_content": {"type": "string"},
+                "contextual_hints": STRING_LIST_SCHEMA
+            },
+            "required": ["primary_attributes", "text_content", "contextual_hints"],
+            "additionalProperties": False
+        },
+        "input_value": {"type": "string"},
+        "wait_conditions": STRING_LIST_SCHEMA,
+        "expected_result": {"type": "string"},
+        "fallback_strategies": STRING_LIST_SCHEMA
+    },
+    "required": [
+        "action_type", "element_type", "element_identification", "input_value",
+        "wait_conditions", "expected_result", "fallback_strategies"
+    ],
+    "additionalProperties": False
+}
+
+ELEMENT_ANALYSIS_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "action_type": {"type": "string", "enum": ["navigate", "input", "click"]},
+        "selected_element": {
+            "type": "object",
+            "properties": {
+                "xpath": {"type": "string"},
+                "css": {"type": "string"},
+                "reason": {"type": "string"}
+            },
+            "required": ["xpath", "css", "reason"],
+            "additionalProperties": False
+        },
+        "input_value": {"type": "string"},
+        "wait_time": {"type": "number"}
+    },
+    "required": ["action_type", "selected_element", "input_value", "wait_time"],
+    "additionalProperties": False
+}
+
+VERIFY_MATCH_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "is_match": {"type": "boolean"},
+        "confidence": {"type": "number"},
+        "reason": {"type": "string"}
+    },
+    "required": ["is_match", "confidence", "reason"],
+    "additionalProperties": False
+}
+
+PLAN_AND_LOCATE_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "action_plan": ACTION_PLAN_SCHEMA,
+        "locators": {
+            "type": "object",
+            "properties": {
+                "id": {"type": "string"},
+                "xpath": STRING_LIST_SCHEMA,
+                "css": STRING_LIST_SCHEMA,
+                "custom": {"type": "string"}
+            },
+            "required": ["id", "xpath", "css", "custom"],
+            "additionalProperties": False
+        },
+        "verification": {
+            "type": "object",
+            "properties": {
+                "confidence_score": {"type": "number"},
+                "verification_attributes": STRING_LIST_SCHEMA
+            },
+            "required": ["confidence_score", "verification_attributes"],
+            "additionalProperties": False
+        }
+    },
+    "required": ["action_plan", "locators", "verification"],
+    "additionalProperties": False
+}
+
+
+def json_schema_format(name: str, schema: Dict) -> Dict:
+    """Build a strict structured-output response_format for a schema"""
+    return {"type": "json_schema", "json_schema": {"name": name, "strict": True, "schema": schema}}
+
+
+@functools.lru_cache(maxsize=64)
+def _sanitize_and_join(output_dir: str, filename: str) -> str:
+    """Return the output path for a script filename, memoized for repeated saves"""
+    return os.path.join(output_dir, sanitize_filename(filename))
+
+
+def compact_json(value: Any) -> str:
+    """Serialize prompt data without whitespace to keep token counts down"""
+    return orjson.dumps(value).decode()
+
+
+class WebAutomationTool(contextlib.AbstractContextManager):
+    # Browsers shared across tool instances, keyed by headless mode, with their element finders.
+    # Each instance gets its own tab and switches back to it before driving the page, since
+    # one driver has a single current window; cookies and storage still belong to the whole
+    # browser profile, and instances sharing a browser must not drive it at the same time.
+    _driver_pool: Dict[bool, Tuple["uc.Chrome", "ElementFinder"]] = {}
+    # Number of instances holding a tab in each pooled browser
+    _open_tabs: Dict[bool, int] = {}
+    # (page URL, step) -> action plan and locators from an earlier successful run, in LRU
+    # order; shared by all instances, loaded from Config.ACTION_CACHE_FILE on the first
+    # step and saved once at exit if it was used
+    _action_cache: Optional[collections.OrderedDict] = None
+    _action_cache_lock = threading.Lock()
+
     def __init__(self, api_key: Optional[str] = None):
         """
         Initialize the Web Automation Tool
@@ -29,37 +341,313 @@ class WebAutomationTool:
             raise ValueError("OpenAI API key is required")
             
         self.driver = None
-        self.actions = []
-        self.client = OpenAI(api_key=self.api_key)
+        self.actions = collections.deque()
+        self.llm_cache = LLMCache(Config.CACHE_DIR)
         
         self.element_finder = None
-        self.script_generator = ScriptGenerator()
+        # This instance's tab in the shared browser and the pool it came from
+        self._window_handle = None
+        self._headless = False
+        self._output_dir_ready = False
         
         self.logger = setup_logger(__name__, Config.LOG_FILE)
+        # Level-bound Logger.log calls, resolved once instead of per log call
+        self._info = functools.partial(self.logger.log, logging.INFO)
+        self._error = functools.partial(self.logger.log, logging.ERROR)
+
+    # Clients and the script generator are created on first use, so runs that
+    # never reach the LLM or script generation do not pay for them
+    @functools.cached_property
+    def client(self):
+        from openai import OpenAI
+        return OpenAI(api_key=self.api_key)
+
+    @functools.cached_property
+    def aclient(self):
+        from openai import AsyncOpenAI
+        return AsyncOpenAI(api_key=self.api_key)
+
+    @functools.cached_property
+    def script_generator(self) -> ScriptGenerator:
+        return ScriptGenerator()
         
-    def initialize_browser(self, headless: bool = False):
-        """Initialize browser with undetected-chromedriver"""
-        try:
+    @classmethod
+    def shared_driver(cls, headless: bool = False) -> Tuple["uc.Chrome", "ElementFinder"]:
+        """
+        Return the browser shared by all instances for a headless mode, launching it on first use
+        
+        Args:
+            headless (bool): Whether the browser runs headless
+            
+        Returns:
+            Tuple[uc.Chrome, ElementFinder]: The shared driver and its element finder
+        """
+        pooled = cls._driver_pool.get(headless)
+        if pooled is not None:
+            try:
+                # Cheap liveness probe; the pooled browser may have been closed or crashed
+                pooled[0].window_handles
+            except Exception:
+                del cls._driver_pool[headless]
+                cls._open_tabs.pop(headless, None)
+
+        if headless not in cls._driver_pool:
+            import undetected_chromedriver as uc
+            from .element_finder import ElementFinder
+
             options = uc.ChromeOptions()
             if headless:
                 options.add_argument('--headless')
+            # Skip the optimization model download Chrome performs on first start
+            options.add_argument(
+                "--disable-features=OptimizationGuideModelDownloading,OptimizationHintsFetching,"
+                "OptimizationTargetPrediction,OptimizationHints"
+            )
+            # Skip first-run setup, background services and keyring prompts that stall start and quit
+            options.add_argument("--no-first-run")
+            options.add_argument("--no-service-autorun")
+            options.add_argument("--password-store=basic")
+            # Avoid idle update, metrics and prefetch traffic competing with the page under test
+            options.add_argument("--disable-background-networking")
+            # Return from driver.get once the DOM is interactive instead of fully loaded
+            options.page_load_strategy = "eager"
             
-            self.driver = uc.Chrome(options=options)
-            self.driver.maximize_window()
+            driver = uc.Chrome(options=options, keep_alive=True)
+            driver.maximize_window()
             
             # Initialize element finder after driver is created
-            self.element_finder = ElementFinder(self.driver)
-            
-            self.logger.info("Browser initialized successfully")
+            cls._driver_pool[headless] = (driver, ElementFinder(driver))
+        return cls._driver_pool[headless]
+
+    def initialize_browser(self, headless: bool = False):
+        """Initialize browser with undetected-chromedriver, opening a tab in the shared browser"""
+        try:
+            self.driver, self.element_finder = self.shared_driver(headless)
+            self.driver.switch_to.new_window('tab')
+            self._window_handle = self.driver.current_window_handle
+            self._headless = headless
+            # Cookies are browser-wide; only clear what a previous instance left behind
+            # when no other instance is using the browser
+            if not self._open_tabs.get(headless):
+                self.driver.delete_all_cookies()
+            self._open_tabs[headless] = self._open_tabs.get(headless, 0) + 1
+            self._info("Browser initialized successfully")
             
         except Exception as e:
-            self.logger.error(f"Failed to initialize browser: {str(e)}")
+            self._error("Failed to initialize browser: %s", e)
             raise BrowserInitializationError(f"Browser initialization failed: {str(e)}")
 
+    def _switch_to_own_tab(self):
+        """Make this instance's tab current again; another instance may have opened or used its own since"""
+        self.driver.switch_to.window(self._window_handle)
+
+    def _cached_completion(self, messages: List[Dict], parse: Callable[[str], Any], model: str = Config.OPENAI_MODEL, **params) -> Any:
+        """
+        Run a chat completion, reusing the cached response for an identical request
+        
+        Only responses that parse successfully are cached, so a malformed
+        answer is retried on the next call rather than replayed. Callers pass
+        temperature=0, since a cached reply stands in for every later call.
+        
+        Args:
+            messages (List[Dict]): Chat messages sent to the model
+            parse (Callable[[str], Any]): Converts the response text into the returned value
+            model (str): Model name
+            **params: Extra completion parameters, part of the cache key
+            
+        Returns:
+            Any: Parsed response
+        """
+        key = LLMCache.make_key(model, messages, schema_version=PROMPT_SCHEMA_VERSION, **params)
+        content = self.llm_cache.get(key)
+        if content is not None:
+            return parse(content)
+
+        response = self.client.chat.completions.create(model=model, messages=messages, **params)
+        content = response.choices[0].message.content
+        result = parse(content)
+        self.llm_cache.set(key, content)
+        return result
+
+    def _element_type(self, tag: str, attrs: Dict[str, str]) -> Optional[str]:
+        """Return the element's effective type, mirroring the DOM type property"""
+        if tag == "INPUT":
+            return attrs.get("type", "").lower() or "text"
+        if tag == "BUTTON":
+            return attrs.get("type", "").lower() or "submit"
+        if tag == "TEXTAREA":
+            return "textarea"
+        return attrs.get("type")
+
+    def _generate_xpath(self, attrs: Dict[str, str], element_type: Optional[str], text: str, full_xpath: str) -> str:
+        """Build the most readable XPath for an element, falling back to its absolute path"""
+        if attrs.get("id"):
+            return f'//*[@id="{attrs["id"]}"]'
+        if attrs.get("aria-label"):
+            return f'//*[@aria-label="{attrs["aria-label"]}"]'
+        if attrs.get("placeholder"):
+            return f'//*[@placeholder="{attrs["placeholder"]}"]'
+        if text:
+            return f'//*[text()="{text}"]'
+
+        path = []
+        if element_type:
+            path.append(f'@type="{element_type}"')
+        if attrs.get("name"):
+            path.append(f'@name="{attrs["name"]}"')
+        if attrs.get("class"):
+            path.append(f'contains(@class, "{attrs["class"]}")')
+        if path:
+            return f"//*[{' and '.join(path)}]"
+
+        return full_xpath
+
+    def _get_page_elements_cdp(self) -> Dict:
+        """
+        Get interactive elements from a single flattened DOM snapshot over CDP
+        
+        XPaths are built during one traversal in Python, counting sibling
+        indices per parent, instead of being recomputed in the page for
+        every element.
+        """
+        nodes = self.driver.execute_cdp_cmd("DOM.getFlattenedDocument", {"depth": -1, "pierce": False})["nodes"]
+
+        children: Dict[int, List[Dict]] = {}
+        document = None
+        for node in nodes:
+            parent_id = node.get("parentId")
+            if parent_id is not None:
+                children.setdefault(parent_id, []).append(node)
+            elif node.get("nodeType") == 9:
+                document = node
+        if document is None:
+            raise ValueError("Flattened DOM has no document node")
+        base_url = document.get("baseURL") or document.get("documentURL", "")
+
+        def text_of(node: Dict) -> str:
+            parts = []
+            stack = [node]
+            while stack:
+                current = stack.pop()
+                if current.get("nodeType") == 3:
+                    parts.append(current.get("nodeValue", ""))
+                elif current.get("nodeName") not in NON_TEXT_TAGS:
+                    stack.extend(reversed(children.get(current["nodeId"], [])))
+            return " ".join("".join(parts).split())
+
+        stack = []
+
+        def push_children(node_id: int, parent_path: str, label: Optional[Dict]):
+            counts: Dict[str, int] = {}
+            entries = []
+            # Text of the nearest preceding sibling, skipping whitespace-only text nodes
+            last_text = ""
+            for child in children.get(node_id, ()):
+                node_type = child.get("nodeType")
+                if node_type == 3:
+                    last_text = child.get("nodeValue", "").strip() or last_text
+                    continue
+                if node_type != 1:
+                    last_text = ""
+                    continue
+                tag = child["nodeName"]
+                counts[tag] = counts.get(tag, 0) + 1
+                entries.append((child, f"{parent_path}/{tag}[{counts[tag]}]", label, last_text))
+                last_text = ""
+            stack.extend(reversed(entries))
+
+        page_elements = {"inputs": [], "buttons": [], "links": []}
+        labels_by_for: Dict[str, Dict] = {}
+        unlabeled_inputs = []
+
+        # Pre-order traversal so each list keeps document order, like querySelectorAll
+        push_children(document["nodeId"], "", None)
+        while stack:
+            node, full_xpath, label, before = stack.pop()
+            tag = node["nodeName"]
+            raw = node.get("attributes", [])
+            attrs = dict(zip(raw[::2], raw[1::2]))
+            if tag == "LABEL":
+                label = node
+                if attrs.get("for"):
+                    labels_by_for.setdefault(attrs["for"], node)
+            push_children(node["nodeId"], full_xpath, label)
+
+            role = attrs.get("role")
+            element_type = self._element_type(tag, attrs)
+            is_input = tag in ("INPUT", "TEXTAREA")
+            is_button = tag == "BUTTON" or (tag == "INPUT" and element_type in ("submit", "button")) or role == "button"
+            is_link = tag == "A" or role == "link"
+            if not (is_input or is_button or is_link):
+                continue
+
+            text = text_of(node)
+            xpath = self._generate_xpath(attrs, element_type, text, full_xpath)
+
+            if is_input:
+                element = {
+                    "tag": tag,
+                    "type": element_type,
+                    "id": attrs.get("id", ""),
+                    "name": attrs.get("name", ""),
+                    "placeholder": attrs.get("placeholder", ""),
+                    "aria-label": attrs.get("aria-label"),
+                    "class": attrs.get("class", ""),
+                    "value": attrs.get("value", ""),
+                    "label": "",
+                    "xpath": xpath,
+                    "preceding_text": before
+                }
+                page_elements["inputs"].append(element)
+                # Labels referenced with for= may appear later in the document
+                unlabeled_inputs.append((element, attrs.get("id"), label))
+            if is_button:
+                page_elements["buttons"].append({
+                    "tag": tag,
+                    "type": element_type,
+                    "id": attrs.get("id", ""),
+                    "text": text or attrs.get("value", ""),
+                    "aria-label": attrs.get("aria-label"),
+                    "class": attrs.get("class", ""),
+                    "role": role,
+                    "xpath": xpath,
+                    "preceding_text": before
+                })
+            if is_link:
+                href = attrs.get("href")
+                page_elements["links"].append({
+                    "tag": tag,
+                    "href": urljoin(base_url, href) if href is not None else ("" if tag == "A" else None),
+                    "text": text,
+                    "aria-label": attrs.get("aria-label"),
+                    "class": attrs.get("class", ""),
+                    "role": role,
+                    "xpath": xpath,
+                    "preceding_text": before
+                })
+
+        for element, element_id, ancestor_label in unlabeled_inputs:
+            label_node = labels_by_for.get(element_id) if element_id else None
+            label_node = label_node or ancestor_label
+            if label_node is not None:
+                element["label"] = text_of(label_node)
+
+        return page_elements
+
     def get_page_elements(self) -> Dict:
         """Get all interactive elements from the current page"""
+        try:
+            return self._get_page_elements_cdp()
+        except Exception as e:
+            self.logger.debug("CDP element extraction failed, falling back to page script: %s", e)
+
         try:
             elements_script = """
+                // Per-node memo caches; ancestors are shared between elements, so
+                // each absolute path segment is only computed once
+                const xpCache = new WeakMap();
+                const precedingCache = new WeakMap();
+
                 return {
                     'inputs': Array.from(document.querySelectorAll('input, textarea')).map(el => ({
                         tag: el.tagName,
@@ -98,11 +686,16 @@ class WebAutomationTool:
                 };
 
                 function getPrecedingText(element) {
+                    if (precedingCache.has(element))
+                        return precedingCache.get(element);
+
                     let previousNode = element.previousSibling;
                     while (previousNode && previousNode.nodeType === 3 && previousNode.textContent.trim() === '') {
                         previousNode = previousNode.previousSibling;
                     }
-                    return previousNode && previousNode.nodeType === 3 ? previousNode.textContent.trim() : '';
+                    const text = previousNode && previousNode.nodeType === 3 ? previousNode.textContent.trim() : '';
+                    precedingCache.set(element, text);
+                    return text;
                 }
 
                 function generateXPath(element) {
@@ -131,6 +724,8 @@ class WebAutomationTool:
                 }
 
                 function getFullXPath(element) {
+                    if (xpCache.has(element))
+                        return xpCache.get(element);
                     if (element.tagName === 'HTML')
                         return '/HTML[1]';
                     if (element === document.body)
@@ -141,8 +736,11 @@ class WebAutomationTool:
 
                     for (let i = 0; i < siblings.length; i++) {
                         let sibling = siblings[i];
-                        if (sibling === element)
-                            return getFullXPath(element.parentNode) + '/' + element.tagName + '[' + (ix + 1) + ']';
+                        if (sibling === element) {
+                            const path = getFullXPath(element.parentNode) + '/' + element.tagName + '[' + (ix + 1) + ']';
+                            xpCache.set(element, path);
+                            return path;
+                        }
                         if (sibling.nodeType === 1 && sibling.tagName === element.tagName)
                             ix++;
                     }
@@ -153,7 +751,7 @@ class WebAutomationTool:
             return page_elements
             
         except Exception as e:
-            self.logger.error(f"Failed to get page elements: {str(e)}")
+            self._error("Failed to get page elements: %s", e)
             return {}
 
     def filter_relevant_elements(self, page_elements: Dict, step_description: str) -> Dict:
@@ -163,62 +761,128 @@ class WebAutomationTool:
         
         # Extract key terms from step
         terms = step.replace("click on", "").replace("enter", "").replace("type", "").replace("in the", "").replace("field", "").strip().split()
+        if not terms:
+            return filtered
+        # One compiled alternation replaces a substring scan per term
+        terms_pattern = re.compile("|".join(map(re.escape, terms)), re.IGNORECASE)
         
+        seen = set()
         for element_type, elements in page_elements.items():
             for element in elements:
-                element_text = json.dumps(element).lower()
-                if any(term.lower() in element_text for term in terms):
-                    filtered[element_type].append(element)
-                    
-                # Check preceding text and labels
-                if element.get('preceding_text') and any(term.lower() in element['preceding_text'].lower() for term in terms):
-                    filtered[element_type].append(element)
-                if element.get('label') and any(term.lower() in element['label'].lower() for term in terms):
+                key = element.get('xpath') or id(element)
+                if key in seen:
+                    continue
+                # Element values include its preceding text and label
+                element_text = "\x1f".join(str(value) for value in element.values() if value)
+                if terms_pattern.search(element_text):
                     filtered[element_type].append(element)
+                    seen.add(key)
         
         return filtered
 
+    def rank_elements(self, page_elements: Dict, step_description: str) -> List[Tuple[float, str, Dict]]:
+        """
+        Score elements by the share of step words found in their identifying fields
+        
+        Args:
+            page_elements (Dict): Elements grouped by type
+            step_description (str): Test step to match against
+            
+        Returns:
+            List[Tuple[float, str, Dict]]: (score, element_type, element), best first
+        """
+        # Quoted input values say nothing about which element to use
+        step = QUOTED_VALUE_RE.sub(" ", step_description.lower())
+        terms = set(WORD_RE.findall(step)) - RANK_STOP_WORDS
+        if not terms:
+            return []
+        
+        ranked = []
+        seen = set()
+        for element_type, elements in page_elements.items():
+            for element in elements:
+                if id(element) in seen:
+                    continue
+                seen.add(id(element))
+                words = set(WORD_RE.findall(" ".join(str(element[field]).lower() for field in RANK_FIELDS if element.get(field))))
+                ranked.append((len(terms & words) / len(terms), element_type, element))
+        
+        ranked.sort(key=lambda candidate: candidate[0], reverse=True)
+        return ranked
+
+    def top_ranked_elements(self, page_elements: Dict, step_description: str) -> Optional[Dict]:
+        """
+        Narrow page elements to the best local matches for a step
+        
+        Returns:
+            Optional[Dict]: The top RANK_TOP_K candidates grouped by type, or None if
+            no element shares a term with the step
+        """
+        ranked = self.rank_elements(self.filter_relevant_elements(page_elements, step_description), step_description)
+        if not ranked or not ranked[0][0]:
+            return None
+        top_elements = {element_type: [] for element_type in page_elements}
+        for _, element_type, element in ranked[:RANK_TOP_K]:
+            top_elements.setdefault(element_type, []).append(element)
+        return top_elements
+
+    def element_css(self, element: Dict) -> str:
+        """Build a CSS selector from an element's id or name, or return '' if it has neither"""
+        for attribute in ("id", "name"):
+            value = element.get(attribute)
+            if value:
+                return '[%s="%s"]' % (attribute, str(value).replace("\\", "\\\\").replace('"', '\\"'))
+        return ""
+
     def analyze_elements_for_action(self, step_description: str, page_elements: Dict) -> Dict:
         """
         Use AI to analyze page elements and determine the best element for the action
+        
+        Candidates are ranked locally first; an unambiguous match is returned without
+        a completion, otherwise only the top-ranked candidates are sent to the model.
         """
         try:
             # Filter relevant elements first
             filtered_elements = self.filter_relevant_elements(page_elements, step_description)
+            ranked = self.rank_elements(filtered_elements, step_description)
             
-            prompt = f"""
-            Analyze these relevant page elements for the step: "{step_description}"
-
-            Available elements:
-            {json.dumps(filtered_elements, indent=2)}
-
-            Return a JSON response in this format:
-            {{
-                "action_type": "navigate|input|click",
-                "selected_element": {{
-                    "xpath": "xpath of the selected element",
-                    "css": "css selector of the selected element",
-                    "reason": "why this element was selected"
-                }},
-                "input_value": "value to input if applicable",
-                "wait_time": recommended wait time in seconds
-            }}
-
-            For search inputs, prefer elements with id 'twotabsearchtextbox' or search-related attributes.
-            For clicks, prefer elements with matching text or relevant attributes.
-            """
+            css = self.element_css(ranked[0][2]) if ranked else ""
+            if css and ranked[0][0] >= Config.LOCAL_MATCH_THRESHOLD and (len(ranked) == 1 or ranked[1][0] < ranked[0][0]):
+                _, element_type, element = ranked[0]
+                value_match = QUOTED_VALUE_RE.search(step_description)
+                return {
+                    "action_type": "input" if element_type == "inputs" and value_match else "click",
+                    "selected_element": {
+                        "xpath": element["xpath"],
+                        "css": css,
+                        "reason": "matches most terms of the step and outscores every other candidate"
+                    },
+                    "input_value": value_match.group(1) if value_match else "",
+                    "wait_time": 0
+                }
+            
+            # Steps made only of stop words (e.g. "Click the button") rank nothing; keep every filtered element then
+            if ranked and ranked[0][0]:
+                filtered_elements = {element_type: [] for element_type in filtered_elements}
+                for _, element_type, element in ranked[:RANK_TOP_K]:
+                    filtered_elements[element_type].append(element)
+            
+            prompt = "".join((
+                ANALYZE_ELEMENTS_PROMPT_PREFIX,
+                "\nStep: ", compact_json(step_description),
+                "\nAvailable elements: ", compact_json(filtered_elements)
+            ))
 
-            response = self.client.chat.completions.create(
-                model="gpt-3.5-turbo",
-                messages=[{"role": "user", "content": prompt}],
-                temperature=0.7,
-                max_tokens=500
+            return self._cached_completion(
+                [{"role": "user", "content": prompt}],
+                orjson.loads,
+                temperature=0,
+                max_tokens=500,
+                response_format=json_schema_format("element_analysis", ELEMENT_ANALYSIS_SCHEMA)
             )
-
-            return json.loads(response.choices[0].message.content)
             
         except Exception as e:
-            self.logger.error(f"Failed to analyze elements: {str(e)}")
+            self._error("Failed to analyze elements: %s", e)
             if "context_length_exceeded" in str(e):
                 # Fallback to basic element finding for common scenarios
                 if "search" in step_description.lower():
@@ -249,52 +913,21 @@ class WebAutomationTool:
         Use AI to analyze the step and determine required action
         """
         try:
-            prompt = f"""
-            Analyze this test step and provide a detailed action plan:
-            "{step_description}"
-
-            Return a JSON object with exactly this structure (no additional text):
-            {{
-                "action_type": "navigate|input|click|select|hover|wait|verify",
-                "element_type": "input|button|link|select|div|etc",
-                "element_identification": {{
-                    "primary_attributes": ["id", "name", "type"],
-                    "text_content": "expected text if any",
-                    "contextual_hints": ["search", "submit", "next"]
-                }},
-                "input_value": "value to input if needed",
-                "wait_conditions": ["presence", "clickable", "visible"],
-                "expected_result": "what should happen after action",
-                "fallback_strategies": ["try alternative locators", "check similar elements"]
-            }}
-            
-            Important: Return ONLY the JSON object, no additional text or explanations.
-            """
+            prompt = "".join((ANALYZE_STEP_PROMPT_PREFIX, "\nStep: ", compact_json(step_description)))
 
-            response = self.client.chat.completions.create(
-                model="gpt-3.5-turbo",
-                messages=[
-                    {"role": "system", "content": "You are a JSON generator that only returns valid JSON objects without any additional text or explanations."},
+            return self._cached_completion(
+                [
+                    {"role": "system", "content": JSON_ONLY_SYSTEM_PROMPT},
                     {"role": "user", "content": prompt}
                 ],
-                temperature=0.3,
-                max_tokens=500
+                orjson.loads,
+                temperature=0,
+                max_tokens=500,
+                response_format=json_schema_format("action_plan", ACTION_PLAN_SCHEMA)
             )
 
-            # Clean the response to ensure it's valid JSON
-            response_text = response.choices[0].message.content.strip()
-            # Remove any potential markdown code block markers
-            response_text = response_text.replace('```json', '').replace('```', '').strip()
-            
-            try:
-                return json.loads(response_text)
-            except json.JSONDecodeError as e:
-                self.logger.error(f"Failed to parse JSON response: {response_text}")
-                # Fallback analysis for common actions
-                return self.fallback_step_analysis(step_description)
-
         except Exception as e:
-            self.logger.error(f"Failed to analyze step: {str(e)}")
+            self._error("Failed to analyze step: %s", e)
             return self.fallback_step_analysis(step_description)
 
     def fallback_step_analysis(self, step_description: str) -> Dict:
@@ -339,7 +972,6 @@ class WebAutomationTool:
         # Input action
         if "enter" in step or "type" in step or "input" in step:
             # Extract the value to input (text between quotes if present)
-            import re
             value_match = re.search(r"'([^']*)'", step)
             input_value = value_match.group(1) if value_match else ""
             
@@ -377,40 +1009,76 @@ class WebAutomationTool:
         Use AI to generate optimal locators based on action plan and available elements
         """
         try:
-            prompt = f"""
-            Generate optimal element locators based on this action plan and available page elements.
-
-            Action Plan:
-            {json.dumps(action_plan, indent=2)}
-
-            Available Page Elements:
-            {json.dumps(page_elements, indent=2)}
-
-            Return a JSON with locator strategies in priority order:
-            {{
-                "locators": {{
-                    "id": "id value if available",
-                    "xpath": ["primary xpath", "fallback xpath"],
-                    "css": ["primary css", "fallback css"],
-                    "custom": "any other unique locator strategy"
-                }},
-                "confidence_score": 0.0 to 1.0,
-                "verification_attributes": ["attributes to verify correct element"]
-            }}
-            """
+            prompt = "".join((
+                ELEMENT_LOCATORS_PROMPT_PREFIX,
+                "\nAction Plan: ", compact_json(action_plan),
+                "\nAvailable Page Elements: ", compact_json(page_elements)
+            ))
 
-            response = self.client.chat.completions.create(
-                model="gpt-3.5-turbo",
-                messages=[{"role": "user", "content": prompt}],
-                temperature=0.5
+            return self._cached_completion(
+                [{"role": "user", "content": prompt}],
+                orjson.loads,
+                temperature=0
             )
 
-            return json.loads(response.choices[0].message.content)
-
         except Exception as e:
-            self.logger.error(f"Failed to generate locators: {str(e)}")
+            self._error("Failed to generate locators: %s", e)
             raise
 
+    def _plan_and_locate(self, step_description: str, page_elements: Dict) -> Optional[Tuple[Dict, Dict]]:
+        """
+        Analyze a step and generate its element locators with a single completion
+        
+        Args:
+            step_description (str): Test step to execute
+            page_elements (Dict): Interactive elements on the current page
+            
+        Returns:
+            Optional[Tuple[Dict, Dict]]: (action_plan, locator_info), or None if the
+            completion failed
+        """
+        # Only the best local matches are sent; steps sharing no term with any element
+        # (e.g. "go back") still get the whole page
+        candidates = self.top_ranked_elements(page_elements, step_description) or page_elements
+        prompt = "".join((
+            PLAN_AND_LOCATE_PROMPT_PREFIX,
+            "\nStep: ", compact_json(step_description),
+            "\nAvailable Page Elements: ", compact_json(candidates)
+        ))
+
+        try:
+            result = self._cached_completion(
+                [
+                    {"role": "system", "content": JSON_ONLY_SYSTEM_PROMPT},
+                    {"role": "user", "content": prompt}
+                ],
+                orjson.loads,
+                temperature=0,
+                response_format=json_schema_format("plan_and_locate", PLAN_AND_LOCATE_SCHEMA)
+            )
+        except Exception as e:
+            self._error("Failed to plan and locate step, falling back to separate calls: %s", e)
+            return None
+
+        locator_info = {
+            "locators": result["locators"],
+            "confidence_score": result["verification"]["confidence_score"],
+            "verification_attributes": result["verification"]["verification_attributes"]
+        }
+        return result["action_plan"], locator_info
+
+    def is_id_locator(self, locator_type: str, locator_value: str) -> bool:
+        """Return True if the locator selects an element by its id alone"""
+        if locator_type == "id":
+            return True
+        if not isinstance(locator_value, str):
+            return False
+        if locator_type == "css":
+            return re.fullmatch(r"([\w-]+)?#[\w-]+", locator_value.strip()) is not None
+        if locator_type == "xpath":
+            return re.fullmatch(r"""//(\*|[\w-]+)\[@id=(["'])[^"']+\2\]""", locator_value.strip()) is not None
+        return False
+
     def verify_element_match(self, element, action_plan: Dict, locator_info: Dict) -> bool:
         """
         Use AI to verify if found element matches the intended target
@@ -418,63 +1086,93 @@ class WebAutomationTool:
         try:
             element_attributes = self.get_element_info(element)
             
-            prompt = f"""
-            Verify if this element matches the intended target.
-
-            Action Plan:
-            {json.dumps(action_plan, indent=2)}
-
-            Found Element:
-            {json.dumps(element_attributes, indent=2)}
-
-            Verification Attributes:
-            {json.dumps(locator_info.get('verification_attributes', []), indent=2)}
-
-            Return a JSON response:
-            {{
-                "is_match": true/false,
-                "confidence": 0.0 to 1.0,
-                "reason": "explanation of decision"
-            }}
-            """
+            prompt = "".join((
+                VERIFY_MATCH_PROMPT_PREFIX,
+                "\nAction Plan: ", compact_json(action_plan),
+                "\nFound Element: ", compact_json(element_attributes),
+                "\nVerification Attributes: ", compact_json(locator_info.get('verification_attributes', []))
+            ))
 
             response = self.client.chat.completions.create(
-                model="gpt-3.5-turbo",
+                model=Config.OPENAI_MODEL,
                 messages=[{"role": "user", "content": prompt}],
-                temperature=0.3
+                temperature=0.3,
+                response_format=json_schema_format("verify_match", VERIFY_MATCH_SCHEMA)
             )
 
-            result = json.loads(response.choices[0].message.content)
+            result = orjson.loads(response.choices[0].message.content)
             return result["is_match"] and result["confidence"] > 0.7
 
         except Exception as e:
-            self.logger.error(f"Failed to verify element match: {str(e)}")
+            self._error("Failed to verify element match: %s", e)
             return False
 
-    def execute_step(self, step_description: str):
+    def _plan_step(self, step_description: str, page_elements: Dict) -> Tuple[Dict, Optional[Dict]]:
+        """
+        Plan a step against a page snapshot using only the LLM, never the driver
+        
+        Args:
+            step_description (str): Test step to plan
+            page_elements (Dict): Interactive elements on the page
+            
+        Returns:
+            Tuple[Dict, Optional[Dict]]: (action_plan, locator_info); locator_info is None
+            when only the step analysis succeeded
+        """
+        plan = self._plan_and_locate(step_description, page_elements)
+        if plan:
+            return plan
+        return self.analyze_step(step_description), None
+
+    def execute_step(self, step_description: str, plan: Optional[Tuple[Dict, Optional[Dict]]] = None,
+                     page_elements: Optional[Dict] = None):
         """
         Execute a test step using AI for analysis and execution
+        
+        Args:
+            step_description (str): Test step to execute
+            plan (Tuple[Dict, Optional[Dict]], optional): (action_plan, locator_info) prepared
+                by _plan_step; when given the step is not planned again
+            page_elements (Dict, optional): Snapshot the plan was made against
         """
         try:
-            # Analyze the step
-            action_plan = self.analyze_step(step_description)
+            self._switch_to_own_tab()
+            # Add wait for page stability
+            self.wait_for_page_stability()
+
+            cache_key = (self.driver.current_url.rstrip('/'), step_description)
+            cached = None if plan else self._get_cached_action(cache_key)
+            if plan:
+                action_plan, locator_info = plan
+                # The snapshot may predate earlier steps, so the first failed lookup rescans
+                dom_version = None
+            elif cached:
+                # Seen on this page before: reuse the plan and locators without asking the LLM
+                action_plan, locator_info = cached["action_plan"], cached["locator_info"]
+                page_elements = None
+                # Unknown DOM version makes the first retry rescan if the cached locators are stale
+                dom_version = None
+            else:
+                # Get page elements
+                page_elements = self.get_page_elements()
+                dom_version = self.get_dom_version()
+
+                # Analyze the step and generate locators in a single completion
+                action_plan, locator_info = self._plan_step(step_description, page_elements)
             
             # Handle navigation separately
             if action_plan["action_type"] == "navigate":
                 url = step_description.replace("navigate to", "").strip().strip("'")
                 self.driver.get(url)
                 self.record_action("navigate", {"url": url}, {"url": url})
-                time.sleep(2)
+                self._cache_action(cache_key, action_plan, locator_info)
                 return
 
-            # Add wait for page stability
-            self.wait_for_page_stability()
+            if locator_info is None:
+                locator_info = self.generate_element_locators(action_plan, page_elements)
 
-            # Get page elements
-            page_elements = self.get_page_elements()
-            
-            # Generate locators
-            locator_info = self.generate_element_locators(action_plan, page_elements)
+            # High-confidence locators are trusted without an extra LLM verification call
+            needs_verification = locator_info.get("confidence_score", 0) < Config.VERIFY_CONFIDENCE_THRESHOLD
             
             # Try to find element with retries
             max_retries = 3
@@ -483,39 +1181,57 @@ class WebAutomationTool:
             
             while retry_count < max_retries and not element:
                 try:
-                    # Try to find element using generated locators
-                    for locator_type, locator_value in locator_info["locators"].items():
-                        if isinstance(locator_value, list):
-                            for loc in locator_value:
-                                element = self.element_finder.find_element_by_locators({locator_type: loc})
-                                if element and self.verify_element_match(element, action_plan, locator_info):
-                                    break
-                        else:
-                            element = self.element_finder.find_element_by_locators({locator_type: locator_value})
-                            if element and self.verify_element_match(element, action_plan, locator_info):
-                                break
+                    # Resolve every generated locator in one script call; only resolved candidates are verified
+                    candidates = [
+                        (locator_type, loc)
+                        for locator_type, locator_value in locator_info["locators"].items()
+                        for loc in (locator_value if isinstance(locator_value, list) else [locator_value])
+                    ]
+                    matches = self.element_finder.find_all_matching(
+                        [{locator_type: loc} for locator_type, loc in candidates], timeout=Config.LOOKUP_TIMEOUT
+                    )
+                    element = None
+                    # Several locators usually resolve to the same element; verify each element once
+                    checked = set()
+                    for (locator_type, loc), match in zip(candidates, matches):
+                        if not match:
+                            continue
+                        # An id lookup can only match one element, so there is nothing for the LLM to verify
+                        if not needs_verification or self.is_id_locator(locator_type, loc):
+                            element = match
+                            break
+                        if match in checked:
+                            continue
+                        checked.add(match)
+                        if self.verify_element_match(match, action_plan, locator_info):
+                            element = match
+                            break
                     
                     if not element:
-                        # Try alternative strategies if element not found
+                        # Try alternative strategies if no match was found or verified
                         element = self.try_alternative_strategies(step_description, action_plan)
                     
                     if not element:
+                        # Back off before retrying: 0.25s, 0.5s, 1s
+                        time.sleep(2 ** retry_count * 0.25)
                         retry_count += 1
-                        time.sleep(1)  # Wait before retry
-                        # Refresh page elements for next attempt
-                        page_elements = self.get_page_elements()
-                        locator_info = self.generate_element_locators(action_plan, page_elements)
+                        # Rescan and regenerate locators only if the DOM changed since the last scan
+                        current_version = self.get_dom_version()
+                        if current_version is None or current_version != dom_version:
+                            dom_version = current_version
+                            page_elements = self.get_page_elements()
+                            locator_info = self.generate_element_locators(action_plan, page_elements)
+                            needs_verification = locator_info.get("confidence_score", 0) < Config.VERIFY_CONFIDENCE_THRESHOLD
                 except Exception as e:
-                    self.logger.debug(f"Retry {retry_count + 1} failed: {str(e)}")
+                    self.logger.debug("Retry %s failed: %s", retry_count + 1, e)
+                    time.sleep(2 ** retry_count * 0.25)
                     retry_count += 1
-                    time.sleep(1)
 
             if not element:
                 raise ElementNotFoundError(f"Could not find matching element for: {step_description}")
 
             # Scroll element into view
             self.driver.execute_script("arguments[0].scrollIntoView(true);", element)
-            time.sleep(0.5)  # Small delay after scroll
 
             # Execute action based on type
             if action_plan["action_type"] == "input":
@@ -523,6 +1239,7 @@ class WebAutomationTool:
                 input_value = action_plan.get("input_value", "").strip("'")
                 element.send_keys(input_value)
                 if any(hint in step_description.lower() for hint in ["search", "submit", "enter"]):
+                    from selenium.webdriver.common.keys import Keys
                     element.send_keys(Keys.RETURN)
                 
             elif action_plan["action_type"] == "click":
@@ -541,15 +1258,84 @@ class WebAutomationTool:
                 locator_info["locators"]
             )
 
+            self._cache_action(cache_key, action_plan, locator_info)
+
             # Wait for any page updates after action
             self.wait_for_page_stability()
 
-            self.logger.info(f"Successfully executed step: {step_description}")
+            self._info("Successfully executed step: %s", step_description)
             
         except Exception as e:
-            self.logger.error(f"Failed to execute step '{step_description}': {str(e)}")
+            self._error("Failed to execute step '%s': %s", step_description, e)
             raise
 
+    @classmethod
+    def _load_action_cache(cls):
+        """Load the persisted action cache once, starting empty if it is missing or unreadable"""
+        with cls._action_cache_lock:
+            if cls._action_cache is not None:
+                return
+            cls._action_cache = collections.OrderedDict()
+            try:
+                with open(Config.ACTION_CACHE_FILE, 'rb') as f:
+                    entries = orjson.loads(f.read())
+                cls._action_cache.update(((url, step), entry) for url, step, entry in entries)
+            except FileNotFoundError:
+                pass
+            except Exception as e:
+                logging.getLogger(__name__).debug("Ignoring unreadable action cache: %s", e)
+
+    @classmethod
+    def save_action_cache(cls):
+        """Persist the action cache so later runs can skip the LLM for known steps"""
+        with cls._action_cache_lock:
+            if not cls._action_cache:
+                return
+            entries = [[url, step, entry] for (url, step), entry in cls._action_cache.items()]
+        # Written beside the cache and swapped in, so an interrupted write never leaves a truncated file
+        tmp_path = f"{Config.ACTION_CACHE_FILE}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(os.path.dirname(Config.ACTION_CACHE_FILE), exist_ok=True)
+            with open(tmp_path, 'wb') as f:
+                f.write(orjson.dumps(entries))
+            os.replace(tmp_path, Config.ACTION_CACHE_FILE)
+        except Exception as e:
+            logging.getLogger(__name__).debug("Failed to save action cache: %s", e)
+            with contextlib.suppress(OSError):
+                os.remove(tmp_path)
+
+    def _get_cached_action(self, key: Tuple[str, str]) -> Optional[Dict]:
+        """Return the cached plan for a page and step, marking it recently used"""
+        self._load_action_cache()
+        with self._action_cache_lock:
+            entry = self._action_cache.get(key)
+            if entry is not None:
+                self._action_cache.move_to_end(key)
+            return entry
+
+    def _cache_action(self, key: Tuple[str, str], action_plan: Dict, locator_info: Optional[Dict]):
+        """Remember the plan and locators of a successfully executed step"""
+        self._load_action_cache()
+        with self._action_cache_lock:
+            self._action_cache[key] = {"action_plan": action_plan, "locator_info": locator_info}
+            self._action_cache.move_to_end(key)
+            while len(self._action_cache) > Config.ACTION_CACHE_SIZE:
+                self._action_cache.popitem(last=False)
+
+    def get_dom_version(self) -> Optional[Tuple[float, int]]:
+        """
+        Identify the current state of the page's DOM
+        
+        Returns:
+            Optional[Tuple[float, int]]: (page time origin, mutation count), or None if it
+            could not be read; equal values mean the DOM has not changed in between
+        """
+        try:
+            return tuple(self.driver.execute_script(DOM_VERSION_SCRIPT))
+        except Exception as e:
+            self.logger.debug("Failed to read DOM version: %s", e)
+            return None
+
     def wait_for_page_stability(self, timeout: int = 10):
         """Wait for page to become stable"""
         try:
@@ -564,38 +1350,49 @@ class WebAutomationTool:
                 });
             """)
             
-            # Wait for any AJAX requests to complete
+            # Wait until the DOM has been quiet for a short idle window with no loading indicators
             self.driver.execute_script("""
                 return new Promise(resolve => {
-                    const observer = new MutationObserver(mutations => {
-                        if (!document.querySelector('.loading, .spinner, .wait')) {
-                            observer.disconnect();
-                            resolve();
+                    let idleTimer = null;
+                    let capTimer = null;
+                    const finish = () => {
+                        observer.disconnect();
+                        clearTimeout(idleTimer);
+                        clearTimeout(capTimer);
+                        resolve();
+                    };
+                    const onIdle = () => {
+                        if (document.querySelector('.loading, .spinner, .wait')) {
+                            idleTimer = setTimeout(onIdle, 150);
+                        } else {
+                            finish();
                         }
+                    };
+                    const observer = new MutationObserver(() => {
+                        clearTimeout(idleTimer);
+                        idleTimer = setTimeout(onIdle, 150);
                     });
                     observer.observe(document.body, {
                         childList: true,
                         subtree: true,
                         attributes: true
                     });
+                    idleTimer = setTimeout(onIdle, 150);
                     // Resolve anyway after 2 seconds
-                    setTimeout(resolve, 2000);
+                    capTimer = setTimeout(finish, 2000);
                 });
             """)
         except Exception as e:
-            self.logger.debug(f"Wait for stability failed: {str(e)}")
+            self.logger.debug("Wait for stability failed: %s", e)
 
     def wait_for_element_clickable(self, element, timeout: int = 10):
         """Wait for element to become clickable"""
         try:
-            end_time = time.time() + timeout
-            while time.time() < end_time:
-                if element.is_displayed() and element.is_enabled():
-                    return True
-                time.sleep(0.5)
-            return False
+            from selenium.webdriver.support import expected_conditions as EC
+            self.element_finder.get_wait(timeout).until(EC.element_to_be_clickable(element))
+            return True
         except Exception as e:
-            self.logger.debug(f"Wait for clickable failed: {str(e)}")
+            self.logger.debug("Wait for clickable failed: %s", e)
             return False
 
     def try_alternative_strategies(self, step_description: str, action_plan: Dict) -> Optional[object]:
@@ -613,33 +1410,20 @@ class WebAutomationTool:
                     "//form[contains(@action, 'login')]//button[@type='submit']"
                 ]
                 
-                for xpath in login_xpaths:
-                    try:
-                        element = self.element_finder.find_element_by_locators({"xpath": xpath})
-                        if element:
-                            return element
-                    except:
-                        continue
+                # One union expression checks every candidate per lookup; the first match in document order wins
+                return self.element_finder.find_element_by_locators({"xpath": " | ".join(login_xpaths)})
             
             return None
             
         except Exception as e:
-            self.logger.debug(f"Alternative strategies failed: {str(e)}")
+            self.logger.debug("Alternative strategies failed: %s", e)
             return None
 
     def get_element_info(self, element) -> Dict:
         """Get element information"""
         try:
-            # Simplified element data collection to reduce tokens
-            element_data = {
-                "tag": element.tag_name,
-                "id": element.get_attribute("id"),
-                "class": element.get_attribute("class"),
-                "type": element.get_attribute("type"),
-                "name": element.get_attribute("name"),
-                "text": element.text,
-                "aria-label": element.get_attribute("aria-label")
-            }
+            # Simplified element data collection to reduce tokens, read in a single round-trip
+            element_data = self.driver.execute_script(ELEMENT_INFO_SCRIPT, element)
             
             # Filter out None values
             element_data = {k: v for k, v in element_data.items() if v}
@@ -647,9 +1431,13 @@ class WebAutomationTool:
             return element_data
             
         except Exception as e:
-            self.logger.error(f"Failed to get element info: {str(e)}")
+            self._error("Failed to get element info: %s", e)
             return {}
 
+    def _locator_prompt(self, element_info: Dict) -> str:
+        """Build the locator generation prompt for an element"""
+        return "".join((LOCATOR_PROMPT_PREFIX, "\nElement: ", compact_json(element_info)))
+
     def generate_locators(self, element_info: Dict) -> Dict[str, str]:
         """
         Generate locators using AI based on element information
@@ -661,73 +1449,185 @@ class WebAutomationTool:
             Dict[str, str]: Generated locators
         """
         try:
-            prompt = f"""
-            Generate robust and unique locators for this element:
-            {json.dumps(element_info, indent=2)}
-            
-            Return a JSON with these locator strategies:
-            1. XPath - prefer unique attributes and text
-            2. CSS Selector - compact and efficient
-            3. ID - if available and unique
-            
-            Consider:
-            - Reliability across page updates
-            - Performance of the locator
-            - Uniqueness in the page context
-            - Readability for maintenance
-            
-            Return only the JSON response.
-            """
-            
             response = self.client.chat.completions.create(
-                model="gpt-3.5-turbo",
-                messages=[{"role": "user", "content": prompt}]
+                model=Config.OPENAI_MODEL,
+                messages=[{"role": "user", "content": self._locator_prompt(element_info)}]
+            )
+            
+            locators = orjson.loads(response.choices[0].message.content)
+            self._info("Successfully generated locators")
+            return locators
+            
+        except Exception as e:
+            self._error("Failed to generate locators: %s", e)
+            return {}
+
+    async def generate_locators_async(self, element_info: Dict) -> Dict[str, str]:
+        """
+        Generate locators for an element without blocking the event loop
+        
+        Args:
+            element_info (Dict): Element information
+            
+        Returns:
+            Dict[str, str]: Generated locators
+        """
+        try:
+            response = await self.aclient.chat.completions.create(
+                model=Config.OPENAI_MODEL,
+                messages=[{"role": "user", "content": self._locator_prompt(element_info)}]
             )
             
-            locators = json.loads(response.choices[0].message.content)
-            self.logger.info("Successfully generated locators")
+            locators = orjson.loads(response.choices[0].message.content)
+            self._info("Successfully generated locators")
             return locators
             
         except Exception as e:
-            self.logger.error(f"Failed to generate locators: {str(e)}")
+            self._error("Failed to generate locators: %s", e)
             return {}
 
+    async def generate_locators_batch(self, element_infos: List[Dict]) -> List[Dict[str, str]]:
+        """
+        Generate locators for many elements concurrently
+        
+        Usage: asyncio.run(tool.generate_locators_batch(element_infos))
+        
+        Args:
+            element_infos (List[Dict]): Element information for each element
+            
+        Returns:
+            List[Dict[str, str]]: Generated locators, in the same order as element_infos
+        """
+        semaphore = asyncio.Semaphore(Config.MAX_CONCURRENT_LLM_CALLS)
+
+        async def bounded(element_info: Dict) -> Dict[str, str]:
+            async with semaphore:
+                return await self.generate_locators_async(element_info)
+
+        return await asyncio.gather(*(bounded(info) for info in element_infos))
+
+    def _parallel_step(self, step: str) -> Optional[str]:
+        """Return the step description if the step is tagged as parallel, None otherwise"""
+        if not step.lower().startswith(PARALLEL_STEP_PREFIX):
+            return None
+        description = step[len(PARALLEL_STEP_PREFIX):].strip()
+        # Navigation changes the page for every other step, so it always runs on its own
+        if description.lower().startswith("navigate to"):
+            return None
+        return description
+
+    async def _run_parallel_steps(self, steps: List[str]):
+        """
+        Plan independent steps concurrently, then execute them in their original order
+        
+        Only the LLM planning overlaps, bounded by Config.MAX_PARALLEL_STEPS; the
+        driver is used from this thread alone, so browser actions never interleave
+        and actions are recorded in step order.
+        """
+        self._switch_to_own_tab()
+        self.wait_for_page_stability()
+        page_elements = self.get_page_elements()
+        url = self.driver.current_url.rstrip('/')
+        semaphore = asyncio.Semaphore(Config.MAX_PARALLEL_STEPS)
+
+        async def plan(step: str) -> Tuple[Dict, Optional[Dict]]:
+            cached = self._get_cached_action((url, step))
+            if cached:
+                return cached["action_plan"], cached["locator_info"]
+            async with semaphore:
+                return await asyncio.to_thread(self._plan_step, step, page_elements)
+
+        plans = await asyncio.gather(*(plan(step) for step in steps))
+        for step, step_plan in zip(steps, plans):
+            self._info("Executing step: %s", step)
+            self.execute_step(step, plan=step_plan, page_elements=page_elements)
+
     def run_test_steps(self, steps: List[str]):
         """
         Run a list of test steps
         
+        Consecutive steps prefixed with "parallel:" are declared independent
+        and planned concurrently, then executed in order; every other step
+        is planned and executed on its own.
+        
         Args:
             steps (List[str]): List of step descriptions to execute
         """
         try:
-            for step in steps:
-                self.logger.info(f"Executing step: {step}")
-                self.execute_step(step)
-                # Add small delay between steps
-                time.sleep(2)
+            index = 0
+            while index < len(steps):
+                group = []
+                while index < len(steps) and self._parallel_step(steps[index]) is not None:
+                    group.append(self._parallel_step(steps[index]))
+                    index += 1
+
+                if group:
+                    asyncio.run(self._run_parallel_steps(group))
+                else:
+                    step = steps[index].strip()
+                    if step.lower().startswith(PARALLEL_STEP_PREFIX):
+                        step = step[len(PARALLEL_STEP_PREFIX):].strip()
+                    self._info("Executing step: %s", step)
+                    self.execute_step(step)
+                    index += 1
+
+                # Let the page settle before the next step
+                self.wait_for_page_stability()
         except Exception as e:
-            self.logger.error(f"Test execution failed: {str(e)}")
+            self._error("Test execution failed: %s", e)
             raise
 
-    def save_script(self, script: str, filename: str = None):
-        """Save generated script to file"""
+    def _write_script(self, script: str, filename: Optional[str]) -> str:
+        """Write one script into the output directory, which must already exist"""
         if filename is None:
             timestamp = generate_timestamp()
             filename = f"test_script_{timestamp}.py"
         
-        filename = sanitize_filename(filename)
-        filepath = os.path.join(Config.SCRIPT_OUTPUT_DIR, filename)
-        
+        filepath = _sanitize_and_join(Config.SCRIPT_OUTPUT_DIR, filename)
+        # Write the encoded script straight to the descriptor instead of through a stdio buffer
+        data = memoryview(script.encode('utf-8'))
+        fd = os.open(filepath, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
         try:
+            # os.write may write less than requested, so keep going until everything is out
+            while data:
+                data = data[os.write(fd, data):]
+        finally:
+            os.close(fd)
+        self._info("Script saved to %s", filepath)
+        return filepath
+
+    def _ensure_output_dir(self):
+        """Create the script output directory on first use"""
+        if not self._output_dir_ready:
             os.makedirs(Config.SCRIPT_OUTPUT_DIR, exist_ok=True)
-            with open(filepath, 'w') as f:
-                f.write(script)
-            self.logger.info(f"Script saved to {filepath}")
-            return filepath
+            self._output_dir_ready = True
+
+    def save_script(self, script: str, filename: str = None):
+        """Save generated script to file"""
+        try:
+            self._ensure_output_dir()
+            return self._write_script(script, filename)
         except Exception as e:
-            self.logger.error(f"Failed to save script: {str(e)}")
+            self._error("Failed to save script: %s", e)
             raise 
 
+    def save_scripts(self, items: List[Tuple[str, Optional[str]]]) -> List[str]:
+        """
+        Save several generated scripts, preparing the output directory once
+        
+        Args:
+            items (List[Tuple[str, Optional[str]]]): (script, filename) pairs
+            
+        Returns:
+            List[str]: Paths of the saved scripts, in the same order
+        """
+        try:
+            self._ensure_output_dir()
+            return [self._write_script(script, filename) for script, filename in items]
+        except Exception as e:
+            self._error("Failed to save scripts: %s", e)
+            raise
+
     def navigate_to_url(self, url: str):
         """
         Navigate to the specified URL
@@ -736,12 +1636,13 @@ class WebAutomationTool:
             url (str): The URL to navigate to
         """
         try:
+            self._switch_to_own_tab()
             self.driver.get(url)
             # Record the navigation action
             self.record_action("navigate", {"url": url}, {"url": url})
-            self.logger.info(f"Navigated to URL: {url}")
+            self._info("Navigated to URL: %s", url)
         except Exception as e:
-            self.logger.error(f"Failed to navigate to URL: {str(e)}")
+            self._error("Failed to navigate to URL: %s", e)
             raise
 
     def record_action(self, action_type: str, element_info: Dict, locators: Dict[str, str]):
@@ -753,18 +1654,32 @@ class WebAutomationTool:
             element_info (Dict): Element information
             locators (Dict[str, str]): Generated locators
         """
-        try:
-            action = {
-                "type": action_type,
-                "element_info": element_info,
-                "locators": locators,
-                "timestamp": datetime.datetime.now().isoformat()
-            }
-            self.actions.append(action)
-            self.logger.info(f"Recorded action: {action_type}")
-        except Exception as e:
-            self.logger.error(f"Failed to record action: {str(e)}")
-            raise 
+        self.actions.append(RecordedAction(
+            ACTION_TYPES.get(action_type) or sys.intern(action_type),
+            element_info,
+            {sys.intern(key): value for key, value in locators.items()},
+            # Raw epoch nanoseconds; formatted once when a script is generated
+            time.time_ns()
+        ))
+        self._info("Recorded action: %s", action_type)
+
+    def _format_timestamps(self) -> List[RecordedAction]:
+        """
+        Return copies of the recorded actions with epoch timestamps as ISO strings
+        
+        The recorded actions are left untouched, so several scripts can be
+        generated from them at once.
+        """
+        from datetime import datetime
+
+        return [
+            RecordedAction(
+                action.type, action.element_info, action.locators,
+                datetime.fromtimestamp(action.timestamp / 1e9).isoformat()
+                if isinstance(action.timestamp, int) else action.timestamp
+            )
+            for action in self.actions
+        ]
 
     def generate_script(self, framework: str, language: str) -> str:
         """
@@ -777,28 +1692,61 @@ class WebAutomationTool:
         Returns:
             str: Generated automation script
         """
+        if not self.actions:
+            raise ScriptGenerationError("No actions recorded to generate script")
+
         try:
-            if not self.actions:
-                raise ScriptGenerationError("No actions recorded to generate script")
+            actions = self._format_timestamps()
 
-            # Use the script generator to create the script
-            script = self.script_generator.generate_script(self.actions, framework)
-            self.logger.info(f"Successfully generated {framework} script in {language}")
+            # Use the script generator to create the script; it returns fragments joined here once
+            script = "".join(self.script_generator.generate_script_parts(actions, framework))
+            self._info("Successfully generated %s script in %s", framework, language)
             return script
 
-        except Exception as e:
-            self.logger.error(f"Failed to generate script: {str(e)}")
-            raise ScriptGenerationError(f"Script generation failed: {str(e)}") 
+        # Malformed recorded actions or an unsupported framework
+        except (KeyError, AttributeError, TypeError, ValueError) as e:
+            self._error("Failed to generate script: %s", e)
+            raise ScriptGenerationError(f"Script generation failed: {str(e)}")
 
     def cleanup(self):
         """
-        Clean up resources and close the browser
+        Clean up resources, closing this instance's tab and leaving the browser shared
         """
         try:
             if self.driver:
-                self.driver.quit()
+                self._switch_to_own_tab()
+                remaining = self._open_tabs.get(self._headless, 1) - 1
+                self._open_tabs[self._headless] = remaining
+                # Cookies are shared by all tabs of the browser, so keep them while other instances run
+                if remaining <= 0:
+                    self.driver.delete_all_cookies()
+                self.driver.close()
+                self.driver.switch_to.window(self.driver.window_handles[0])
                 self.driver = None
-            self.logger.info("Cleanup completed successfully")
+                self.element_finder = None
+            self._info("Cleanup completed successfully")
         except Exception as e:
-            self.logger.error(f"Error during cleanup: {str(e)}")
-            raise 
\ No newline at end of file
+            self._error("Error during cleanup: %s", e)
+            raise
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.cleanup()
+
+    @classmethod
+    def shutdown_drivers(cls):
+        """
+        Close every pooled browser
+        """
+        cls._open_tabs.clear()
+        while cls._driver_pool:
+            _, (driver, _) = cls._driver_pool.popitem()
+            try:
+                driver.quit()
+            except Exception:
+                pass
+
+
+# Pooled browsers and the action cache outlive individual tool instances; quit the
+# browsers and persist the cache once when the interpreter exits
+atexit.register(WebAutomationTool.shutdown_drivers)
+atexit.register(WebAutomationTool.save_action_cache)
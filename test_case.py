@@ -1,5 +1,6 @@
 import os
 import time
+from concurrent.futures import ThreadPoolExecutor
 from src.web_automation_tool import WebAutomationTool
 from src.config import Config
 
@@ -25,13 +26,17 @@ def main():
         # Execute test steps
         tool.run_test_steps(test_steps)
         
-        # Generate scripts for different frameworks
-        selenium_script = tool.generate_script("selenium", "python")
-        playwright_script = tool.generate_script("playwright", "python")
+        # Generate scripts for different frameworks concurrently
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            selenium_future = executor.submit(tool.generate_script, "selenium", "python")
+            playwright_future = executor.submit(tool.generate_script, "playwright", "python")
+            selenium_script, playwright_script = selenium_future.result(), playwright_future.result()
         
         # Save the generated scripts
-        tool.save_script(selenium_script, "amazon_search_selenium.py")
-        tool.save_script(playwright_script, "amazon_search_playwright.py")
+        tool.save_scripts([
+            (selenium_script, "amazon_search_selenium.py"),
+            (playwright_script, "amazon_search_playwright.py")
+        ])
         
         print("\nGenerated Scripts:")
         print("1. Selenium Script: generated_scripts/amazon_search_selenium.py")
@@ -0,0 +1,32 @@
+import unittest
+from src.script_generator import ScriptGenerator
+
+class TestScriptGenerator(unittest.TestCase):
+    def setUp(self):
+        self.generator = ScriptGenerator()
+        self.actions = [
+            {"type": "navigate", "element_info": {"url": "https://example.com"}, "locators": {"url": "https://example.com"}},
+            {
+                "type": "input",
+                "element_info": {"value": 'say "hi"\nthen leave'},
+                "locators": {"xpath": ["//input[@aria-label=\"Search\"]", "//input"], "css": "input[name=\"q\"]"}
+            },
+            {"type": "click", "element_info": {}, "locators": {"xpath": "//button[text()=\"Go\"]", "css": "button.go"}}
+        ]
+
+    def test_generated_scripts_escape_recorded_values(self):
+        for framework in ("selenium", "playwright"):
+            script = self.generator.generate_script(self.actions, framework)
+            compile(script, f"{framework}_script.py", "exec")
+
+    def test_list_locators_use_primary_candidate(self):
+        script = self.generator.generate_script(self.actions, "selenium")
+        self.assertIn('(By.XPATH, "//input[@aria-label=\\"Search\\"]")', script)
+        self.assertNotIn('"//input"', script)
+
+    def test_unsupported_framework(self):
+        with self.assertRaises(ValueError):
+            self.generator.generate_script(self.actions, "cypress")
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,15 @@
+import unittest
+from src.utils import sanitize_filename
+
+class TestUtils(unittest.TestCase):
+    def test_sanitize_filename_keeps_word_characters(self):
+        self.assertEqual(sanitize_filename("login_test-01"), "login_test-01")
+
+    def test_sanitize_filename_keeps_extension(self):
+        self.assertEqual(sanitize_filename("amazon_search_selenium.py"), "amazon_search_selenium.py")
+
+    def test_sanitize_filename_replaces_invalid_characters(self):
+        self.assertEqual(sanitize_filename("../my test/script?.py"), "_my_test_script_.py")
+
+if __name__ == '__main__':
+    unittest.main()
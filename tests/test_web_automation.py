@@ -1,17 +1,31 @@
+import os
+import tempfile
 import unittest
 from unittest.mock import MagicMock, patch
+from src.config import Config
 from src.web_automation_tool import WebAutomationTool
 from src.exceptions import BrowserInitializationError
 
 class TestWebAutomationTool(unittest.TestCase):
     def setUp(self):
         self.api_key = "test_api_key"
+        # Keep the shared action cache away from the developer's real one
+        cache_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(cache_dir.cleanup)
+        cache_file = patch.object(Config, 'ACTION_CACHE_FILE', os.path.join(cache_dir.name, 'actions.json'))
+        cache_file.start()
+        self.addCleanup(cache_file.stop)
+        WebAutomationTool._action_cache = None
+        self.addCleanup(setattr, WebAutomationTool, '_action_cache', None)
         self.tool = WebAutomationTool(self.api_key)
 
+    def tearDown(self):
+        WebAutomationTool.shutdown_drivers()
+
     def test_initialization(self):
         self.assertEqual(self.tool.api_key, self.api_key)
         self.assertIsNone(self.tool.driver)
-        self.assertEqual(self.tool.actions, [])
+        self.assertEqual(list(self.tool.actions), [])
 
     @patch('undetected_chromedriver.Chrome')
     def test_browser_initialization(self, mock_chrome):
@@ -25,5 +39,68 @@ class TestWebAutomationTool(unittest.TestCase):
         with self.assertRaises(BrowserInitializationError):
             self.tool.initialize_browser()
 
+    @patch('undetected_chromedriver.Chrome')
+    def test_navigation_returns_to_own_tab(self, mock_chrome):
+        mock_chrome.return_value.current_window_handle = "tab-a"
+        self.tool.initialize_browser()
+        mock_chrome.return_value.current_window_handle = "tab-b"
+        other = WebAutomationTool(self.api_key)
+        other.initialize_browser()
+        self.tool.navigate_to_url("https://example.com")
+        mock_chrome.return_value.switch_to.window.assert_called_with("tab-a")
+
+    def test_rank_elements_scores_share_of_step_terms(self):
+        email = {"id": "email", "xpath": "//input[@id='email']"}
+        password = {"name": "password", "xpath": "//input[@name='password']"}
+        ranked = self.tool.rank_elements({"inputs": [password, email]}, "Enter 'password' in the email field")
+        self.assertEqual([(score, element) for score, _, element in ranked], [(1.0, email), (0.0, password)])
+        self.assertEqual(self.tool.rank_elements({"inputs": [email]}, "Click on the button"), [])
+
+    def test_analyze_elements_skips_model_for_unambiguous_match(self):
+        page_elements = {
+            "inputs": [{"id": "email", "xpath": "//input[@id='email']"}],
+            "buttons": [{"text": "Sign in", "xpath": "//button[1]"}]
+        }
+        with patch.object(self.tool, '_cached_completion') as mock_completion:
+            result = self.tool.analyze_elements_for_action("Enter 'a@b.c' in the email field", page_elements)
+        mock_completion.assert_not_called()
+        self.assertEqual(result["action_type"], "input")
+        self.assertEqual(result["selected_element"]["css"], '[id="email"]')
+        self.assertEqual(result["input_value"], "a@b.c")
+
+    def test_analyze_elements_asks_model_below_threshold(self):
+        page_elements = {"buttons": [{"id": "sign", "text": "Sign", "xpath": "//button[1]"}]}
+        with patch.object(self.tool, '_cached_completion', return_value={}) as mock_completion:
+            self.tool.analyze_elements_for_action("Click on sign in now", page_elements)
+        mock_completion.assert_called_once()
+
+    def test_analyze_elements_keeps_filtered_elements_when_nothing_ranks(self):
+        page_elements = {"buttons": [{"text": "the button", "xpath": "//button[1]"}]}
+        with patch.object(self.tool, '_cached_completion', return_value={}) as mock_completion:
+            self.tool.analyze_elements_for_action("Click the button", page_elements)
+        prompt = mock_completion.call_args[0][0][0]["content"]
+        self.assertIn("//button[1]", prompt)
+
+    def test_plan_and_locate_sends_only_ranked_candidates(self):
+        page_elements = {"buttons": [{"id": "submit", "xpath": "//button[1]"}, {"id": "cancel", "xpath": "//button[2]"}]}
+        with patch.object(self.tool, '_cached_completion', side_effect=Exception("stop")) as mock_completion:
+            self.tool._plan_and_locate("Click on submit", page_elements)
+        prompt = mock_completion.call_args[0][0][1]["content"]
+        self.assertIn("submit", prompt)
+        self.assertNotIn("cancel", prompt)
+
+    def test_generate_script_leaves_recorded_actions_unchanged(self):
+        self.tool.record_action("navigate", {"url": "https://example.com"}, {})
+        timestamp = self.tool.actions[0].timestamp
+        script = self.tool.generate_script("selenium", "python")
+        self.assertIn('driver.get("https://example.com")', script)
+        self.assertEqual(self.tool.actions[0].timestamp, timestamp)
+
+    def test_action_cache_loads_on_first_use(self):
+        self.assertIsNone(WebAutomationTool._action_cache)
+        plan = {"action_type": "click"}
+        self.tool._cache_action(("https://example.com", "Click on submit"), plan, None)
+        self.assertEqual(self.tool._get_cached_action(("https://example.com", "Click on submit"))["action_plan"], plan)
+
 if __name__ == '__main__':
     unittest.main() 
\ No newline at end of file